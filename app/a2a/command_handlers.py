@@ -7,34 +7,170 @@ plain text messages from Telex.
 
 from __future__ import annotations
 
+import asyncio
 import re
+import time
+import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, cast
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.automation import get_automation_service
+from app.db.base import AsyncSessionLocal
 from app.db.repositories.email_repository import EmailRepository
 from app.db.repositories.match_repository import MatchRepository
 from app.db.repositories.transaction_repository import TransactionRepository
 from app.db.models.email import Email
 from app.db.models.match import Match
 from app.db.models.transaction import Transaction
+from app.emails.router import trigger_fetch
 from app.matching.engine import match_unmatched
 from app.matching.models import BatchMatchResult
+from app.transactions.router import trigger_poll
 
 
 logger = structlog.get_logger("a2a.handlers")
 
+# Parameter defaults shared by handlers and extractors
+DEFAULT_SUMMARY_DAYS = 7
+DEFAULT_UNMATCHED_LIMIT = 10
+DEFAULT_METRICS_HOURS = 24
+DEFAULT_LOG_LIMIT = 50
+
+# Cap on reconciliation artifacts returned inline to Telex per batch
+MAX_RECONCILIATION_ARTIFACTS = 500
+# Top-ranked alternatives serialized per reconciliation artifact
+MAX_ALTERNATIVES_PER_RESULT = 5
+
+# How long a finished background matching job's result is kept unread
+MATCH_JOB_TTL_SECONDS = 3600.0
+# Finished background matching jobs kept for match_result at most
+MAX_FINISHED_MATCH_JOBS = 32
+
+# How long a show_summary response is reused for the same look-back window
+SUMMARY_CACHE_TTL_SECONDS = 300.0
+# Distinct look-back windows cached at once; the oldest entry is evicted
+SUMMARY_CACHE_MAX_ENTRIES = 16
+
+# show_summary responses keyed by days, with the monotonic time they were
+# built. This is a plain TTL cache: matches, fetches and polls run through
+# these handlers clear it early, but writes from elsewhere (the automation
+# cycle, the REST fetch/poll routes, message/send reconciliation) only show
+# up once an entry expires.
+_SUMMARY_CACHE: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+
+
+@dataclass
+class _MatchJob:
+    """A background matching run started by match_now."""
+
+    task: asyncio.Task
+    limit: Optional[int]
+    rematch: bool
+    finished_at: Optional[float] = None
+
+
+# Background matching jobs keyed by job ID, in start order. A job is dropped
+# once match_result reads it, or by _prune_match_jobs once it has expired.
+_MATCH_JOBS: Dict[str, _MatchJob] = {}
+
+
+async def _run_match_job(limit: Optional[int]) -> BatchMatchResult:
+    """Run matching on a fresh session, outliving the request that started it."""
+    async with AsyncSessionLocal() as db:
+        return await match_unmatched(db, limit=limit)
+
+
+def _match_job_done(job_id: str, job: _MatchJob, task: asyncio.Task) -> None:
+    """Stamp a finished background job and log (and so retrieve) its error."""
+    job.finished_at = time.monotonic()
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(
+            "handler.match_now.job_failed", job_id=job_id, error=str(task.exception())
+        )
+
+
+def _running_match_job() -> Optional[str]:
+    """Return the ID of the background matching job still running, if any."""
+    for job_id, job in _MATCH_JOBS.items():
+        if not job.task.done():
+            return job_id
+    return None
+
+
+def _prune_match_jobs() -> None:
+    """Drop finished jobs past their TTL, then the oldest beyond the cap."""
+    now = time.monotonic()
+    finished = [
+        (job_id, job.finished_at)
+        for job_id, job in _MATCH_JOBS.items()
+        if job.finished_at is not None
+    ]
+    excess = len(finished) - MAX_FINISHED_MATCH_JOBS
+    for i, (job_id, finished_at) in enumerate(finished):
+        if i < excess or now - finished_at >= MATCH_JOB_TTL_SECONDS:
+            del _MATCH_JOBS[job_id]
+
+
+# list_unmatched cursors are opaque "c<hex>" tokens: a single word with no
+# standalone digit runs, so extract_limit never reads a number out of one.
+def _encode_cursor(row: Any) -> str:
+    """Encode a list_unmatched keyset cursor for the last row of a page."""
+    return "c" + f"{row.created_at.isoformat()}_{row.id}".encode().hex()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor built by _encode_cursor into (created_at, id)."""
+    created_at, _, row_id = bytes.fromhex(cursor[1:]).decode().rpartition("_")
+    return datetime.fromisoformat(created_at), int(row_id)
+
+
+# Unmatched artifacts keep Decimal amounts and datetimes as-is; the A2A
+# response encoder (ORJSONResponse) serializes both natively.
+def _unmatched_email_artifact(email: Any) -> Dict[str, Any]:
+    """Build the list_unmatched artifact for an unmatched email row."""
+    return {
+        "kind": "unmatched_email",
+        "data": {
+            "email_id": email.id,
+            "sender": email.sender,
+            "subject": email.subject,
+            "amount": email.amount,
+            "currency": email.currency,
+            "reference": email.reference,
+            "received_at": email.received_at,
+        },
+    }
+
+
+def _unmatched_transaction_artifact(txn: Any) -> Dict[str, Any]:
+    """Build the list_unmatched artifact for an unmatched transaction row."""
+    return {
+        "kind": "unmatched_transaction",
+        "data": {
+            "transaction_id": txn.id,
+            "reference": txn.reference,
+            "amount": txn.amount,
+            "currency": txn.currency,
+            "description": txn.description,
+            "transaction_timestamp": txn.transaction_timestamp,
+            "external_source": txn.external_source,
+        },
+    }
+
 
 class CommandHandlers:
     """Collection of command handler functions."""
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.email_repo = EmailRepository(Email, db)
-        self.match_repo = MatchRepository(Match, db)
-        self.transaction_repo = TransactionRepository(Transaction, db)
+        self.email_repo = EmailRepository.for_session(Email, db)
+        self.match_repo = MatchRepository.for_session(Match, db)
+        self.transaction_repo = TransactionRepository.for_session(Transaction, db)
 
     def _as_dict(self, obj: Any) -> Dict[str, Any]:
         """Normalize a Pydantic model or mapping to a plain dict.
@@ -60,45 +196,56 @@ class CommandHandlers:
         Params:
             limit (optional): Number of emails to process
             rematch (optional): Force re-matching of already matched emails
+            background (optional): Start matching as a background job and
+                return its ID immediately; fetch results with match_result
         """
         limit = params.get("limit")
         rematch = params.get("rematch", False)
 
         logger.info("handler.match_now.start", limit=limit, rematch=rematch)
 
-        try:
-            # Run reconciliation
-            batch_result = await match_unmatched(self.db, limit=limit)
-
-            summary = (
-                f"✅ Matching complete!\n\n"
-                f"📊 **Results:**\n"
-                f"  • Total processed: {batch_result.total_emails}\n"
-                f"  • Auto-matched: {batch_result.total_matched}\n"
-                f"  • Needs review: {batch_result.total_needs_review}\n"
-                f"  • Rejected: {batch_result.total_rejected}\n"
-                f"  • No candidates: {batch_result.total_no_candidates}\n"
-                f"  • Avg confidence: {batch_result.average_confidence:.2%}\n"
-            )
-
-            # Build artifact list
-            artifacts = self._build_reconciliation_artifacts(batch_result)
+        if params.get("background"):
+            _prune_match_jobs()
+            running_id = _running_match_job()
+            if running_id is not None:
+                logger.info("handler.match_now.already_running", job_id=running_id)
+                return {
+                    "status": "pending",
+                    "summary": (
+                        f"⏳ Matching job {running_id} is already running.\n\n"
+                        f'Say "match result {running_id}" to check on it.'
+                    ),
+                    "artifacts": [],
+                    "meta": {"job_id": running_id},
+                }
 
-            logger.info(
-                "handler.match_now.success",
-                total=batch_result.total_emails,
-                matched=batch_result.total_matched,
+            job_id = uuid.uuid4().hex
+            job = _MatchJob(
+                task=asyncio.create_task(_run_match_job(limit)),
+                limit=limit,
+                rematch=rematch,
             )
-
+            job.task.add_done_callback(lambda task: _match_job_done(job_id, job, task))
+            _MATCH_JOBS[job_id] = job
+            logger.info("handler.match_now.accepted", job_id=job_id)
             return {
-                "status": "success",
-                "summary": summary,
-                "artifacts": artifacts,
+                "status": "accepted",
+                "summary": (
+                    f"⏳ Matching started in the background.\n\n"
+                    f"Job ID: {job_id}\n"
+                    f'Say "match result {job_id}" to check on it.'
+                ),
+                "artifacts": [],
                 "meta": {
-                    "batch": batch_result.get_summary(),
+                    "job_id": job_id,
                     "params": {"limit": limit, "rematch": rematch},
                 },
             }
+
+        try:
+            # Run reconciliation (waits for any batch already in progress)
+            batch_result = await match_unmatched(self.db, limit=limit)
+            return self._match_response(batch_result, limit=limit, rematch=rematch)
         except Exception as exc:  # noqa: BLE001
             logger.exception("handler.match_now.error", error=str(exc))
             return {
@@ -108,6 +255,91 @@ class CommandHandlers:
                 "meta": {"error": str(exc)},
             }
 
+    async def match_result(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Report on a background matching job started by match_now.
+
+        Params:
+            job_id: Job ID returned by match_now
+        """
+        _prune_match_jobs()
+        job_id = params.get("job_id")
+        job = _MATCH_JOBS.get(job_id) if job_id else None
+
+        logger.info("handler.match_result.start", job_id=job_id)
+
+        if job_id is None or job is None:
+            return {
+                "status": "error",
+                "summary": f"❌ No matching job found with ID {job_id}",
+                "artifacts": [],
+                "meta": {"job_id": job_id},
+            }
+
+        task = job.task
+        if not task.done():
+            return {
+                "status": "pending",
+                "summary": f"⏳ Matching job {job_id} is still running.",
+                "artifacts": [],
+                "meta": {"job_id": job_id},
+            }
+
+        del _MATCH_JOBS[job_id]
+        exc = task.exception()
+        if exc is not None:
+            logger.error("handler.match_result.error", job_id=job_id, error=str(exc))
+            return {
+                "status": "error",
+                "summary": f"❌ Matching failed: {str(exc)}",
+                "artifacts": [],
+                "meta": {"job_id": job_id, "error": str(exc)},
+            }
+
+        response = self._match_response(
+            task.result(), limit=job.limit, rematch=job.rematch
+        )
+        response["meta"]["job_id"] = job_id
+        return response
+
+    def _match_response(
+        self, batch_result: BatchMatchResult, limit: Optional[int], rematch: bool
+    ) -> Dict[str, Any]:
+        """Build the handler response for a completed matching batch."""
+        _SUMMARY_CACHE.clear()
+        summary = (
+            f"✅ Matching complete!\n\n"
+            f"📊 **Results:**\n"
+            f"  • Total processed: {batch_result.total_emails}\n"
+            f"  • Auto-matched: {batch_result.total_matched}\n"
+            f"  • Needs review: {batch_result.total_needs_review}\n"
+            f"  • Rejected: {batch_result.total_rejected}\n"
+            f"  • No candidates: {batch_result.total_no_candidates}\n"
+            f"  • Avg confidence: {batch_result.average_confidence:.2%}\n"
+        )
+
+        # Build artifact list (bounded; full counts stay in meta.batch)
+        artifacts = self._build_reconciliation_artifacts(
+            batch_result, limit=MAX_RECONCILIATION_ARTIFACTS
+        )
+
+        logger.info(
+            "handler.match_now.success",
+            total=batch_result.total_emails,
+            matched=batch_result.total_matched,
+        )
+
+        return {
+            "status": "success",
+            "summary": summary,
+            "artifacts": artifacts,
+            "meta": {
+                "batch": batch_result.get_summary(),
+                "params": {"limit": limit, "rematch": rematch},
+                "artifacts_truncated": len(batch_result.results) > len(artifacts),
+            },
+        }
+
     async def show_summary(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Show summary of current reconciliation state.
@@ -115,32 +347,31 @@ class CommandHandlers:
         Params:
             days (optional): Number of days to look back (default: 7)
         """
-        days = params.get("days", 7)
+        days = params.get("days", DEFAULT_SUMMARY_DAYS)
         since = datetime.now(timezone.utc) - timedelta(days=days)
+        since_iso = since.isoformat()
 
-        logger.info("handler.show_summary.start", days=days)
+        logger.info("handler.show_summary.start", days=days, since=since_iso)
 
-        try:
-            # Get counts from database
-            total_emails = await self.email_repo.count(created_at__gte=since)
-            total_transactions = await self.transaction_repo.count(
-                created_at__gte=since
-            )
-            total_matches = await self.match_repo.count(created_at__gte=since)
+        cached = _SUMMARY_CACHE.get(days)
+        if cached is not None:
+            built_at, response = cached
+            if time.monotonic() - built_at < SUMMARY_CACHE_TTL_SECONDS:
+                logger.info("handler.show_summary.cached", days=days)
+                return response
 
-            # Get match status breakdown
-            matched_count = await self.match_repo.count(
-                status="matched", created_at__gte=since
-            )
-            needs_review_count = await self.match_repo.count(
-                status="review", created_at__gte=since
-            )
-            rejected_count = await self.match_repo.count(
-                status="rejected", created_at__gte=since
-            )
-            no_candidates_count = await self.match_repo.count(
-                status="no_candidates", created_at__gte=since
-            )
+        try:
+            # Get all counts from database in a single round-trip
+            counts = await self.match_repo.get_summary_counts(since)
+            total_emails = counts["emails"]
+            total_transactions = counts["transactions"]
+            total_matches = counts["matches"]
+
+            # Match status breakdown
+            matched_count = counts["matched"]
+            needs_review_count = counts["review"]
+            rejected_count = counts["rejected"]
+            no_candidates_count = counts["no_candidates"]
 
             unmatched_emails = total_emails - total_matches
 
@@ -165,7 +396,7 @@ class CommandHandlers:
                 total_matches=total_matches,
             )
 
-            return {
+            response = {
                 "status": "success",
                 "summary": summary,
                 "artifacts": [
@@ -187,8 +418,13 @@ class CommandHandlers:
                         },
                     }
                 ],
-                "meta": {"days": days, "since": since.isoformat()},
+                "meta": {"days": days, "since": since_iso},
             }
+            _SUMMARY_CACHE.pop(days, None)
+            if len(_SUMMARY_CACHE) >= SUMMARY_CACHE_MAX_ENTRIES:
+                del _SUMMARY_CACHE[next(iter(_SUMMARY_CACHE))]
+            _SUMMARY_CACHE[days] = (time.monotonic(), response)
+            return response
         except Exception as exc:  # noqa: BLE001
             logger.exception("handler.show_summary.error", error=str(exc))
             return {
@@ -204,116 +440,90 @@ class CommandHandlers:
 
         Params:
             limit (optional): Number of results to return per category (default: 10)
+            email_cursor (optional): ``next_email_cursor`` from a previous page
+            transaction_cursor (optional): ``next_transaction_cursor`` from a
+                previous page
         """
-        limit = params.get("limit", 10)
+        limit = params.get("limit", DEFAULT_UNMATCHED_LIMIT)
+        email_cursor = params.get("email_cursor")
+        transaction_cursor = params.get("transaction_cursor")
 
         logger.info("handler.list_unmatched.start", limit=limit)
 
         try:
-            # Get matched email IDs and transaction IDs
-            matched_email_ids = await self.match_repo.get_matched_email_ids()
-            matched_transaction_ids = await self.match_repo.get_matched_transaction_ids()
-
-            # Build query for unmatched emails
-            from sqlalchemy import select, desc
-
-            email_query = select(self.email_repo.model)
-
-            # Filter out matched emails
-            if matched_email_ids:
-                email_query = email_query.where(~self.email_repo.model.id.in_(matched_email_ids))
-
-            # Order and limit
-            email_query = email_query.order_by(desc(self.email_repo.model.created_at)).limit(limit)
-
-            # Execute email query
-            email_result = await self.email_repo.session.execute(email_query)
-            unmatched_emails = list(email_result.scalars().all())
-
-            # Build query for unmatched transactions
-            transaction_query = select(self.transaction_repo.model)
-
-            # Filter out matched transactions
-            if matched_transaction_ids:
-                transaction_query = transaction_query.where(
-                    ~self.transaction_repo.model.id.in_(matched_transaction_ids)
-                )
-
-            # Order and limit
-            transaction_query = transaction_query.order_by(
-                desc(self.transaction_repo.model.created_at)
-            ).limit(limit)
-
-            # Execute transaction query
-            transaction_result = await self.transaction_repo.session.execute(transaction_query)
-            unmatched_transactions = list(transaction_result.scalars().all())
+            # Anti-join queries: unmatched rows are resolved in the database.
+            # Each list is keyset-paginated on (created_at, id) independently,
+            # since the two tails rarely line up.
+            unmatched_emails = await self.email_repo.list_unmatched(
+                limit, before=_decode_cursor(email_cursor) if email_cursor else None
+            )
+            unmatched_transactions = await self.transaction_repo.list_unmatched(
+                limit,
+                before=(
+                    _decode_cursor(transaction_cursor) if transaction_cursor else None
+                ),
+            )
+            next_email_cursor = (
+                _encode_cursor(unmatched_emails[-1])
+                if len(unmatched_emails) == limit
+                else None
+            )
+            next_transaction_cursor = (
+                _encode_cursor(unmatched_transactions[-1])
+                if len(unmatched_transactions) == limit
+                else None
+            )
 
             # Build summary and artifacts
             if not unmatched_emails and not unmatched_transactions:
                 summary = "✅ Great! No unmatched emails or transactions found."
                 artifacts: List[Dict[str, Any]] = []
             else:
-                summary = f"📋 **Unmatched Items**\n\n"
+                # Collect summary pieces and join once instead of repeated +=
+                parts = ["📋 **Unmatched Items**\n\n"]
 
                 # Add email summary
                 if unmatched_emails:
-                    summary += f"**Emails** (Showing {len(unmatched_emails)})\n"
-                    for email in unmatched_emails:
-                        summary += f"  • Email #{email.id} - {email.sender} - ₦{email.amount:,.2f} ({email.parsed_at or email.received_at})\n"
-                    summary += "\n"
+                    parts.append(f"**Emails** (Showing {len(unmatched_emails)})\n")
+                    parts.extend(
+                        f"  • Email #{email.id} - {email.sender} - ₦{email.amount:,.2f} ({email.parsed_at or email.received_at})\n"
+                        for email in unmatched_emails
+                    )
+                    parts.append("\n")
                 else:
-                    summary += "**Emails**: None\n\n"
+                    parts.append("**Emails**: None\n\n")
 
                 # Add transaction summary
                 if unmatched_transactions:
-                    summary += f"**Transactions** (Showing {len(unmatched_transactions)})\n"
-                    for txn in unmatched_transactions:
-                        summary += f"  • Transaction #{txn.id} - {txn.reference or 'N/A'} - {txn.currency}{txn.amount:,.2f} ({txn.transaction_timestamp})\n"
+                    parts.append(
+                        f"**Transactions** (Showing {len(unmatched_transactions)})\n"
+                    )
+                    parts.extend(
+                        f"  • Transaction #{txn.id} - {txn.reference or 'N/A'} - {txn.currency}{txn.amount:,.2f} ({txn.transaction_timestamp})\n"
+                        for txn in unmatched_transactions
+                    )
                 else:
-                    summary += "**Transactions**: None\n"
+                    parts.append("**Transactions**: None\n")
 
-                # Build artifacts
-                artifacts = []
-                for email in unmatched_emails:
-                    artifacts.append(
-                        {
-                            "kind": "unmatched_email",
-                            "data": {
-                                "email_id": email.id,
-                                "sender": email.sender,
-                                "subject": email.subject,
-                                "amount": float(email.amount) if email.amount else None,
-                                "currency": email.currency,
-                                "reference": email.reference,
-                                "received_at": (
-                                    email.received_at.isoformat()
-                                    if email.received_at
-                                    else None
-                                ),
-                            },
-                        }
+                if next_email_cursor:
+                    parts.append(
+                        f'\nSay "list unmatched email cursor {next_email_cursor}" '
+                        f"for more emails.\n"
                     )
-
-                for txn in unmatched_transactions:
-                    artifacts.append(
-                        {
-                            "kind": "unmatched_transaction",
-                            "data": {
-                                "transaction_id": txn.id,
-                                "reference": txn.reference,
-                                "amount": float(txn.amount) if txn.amount else None,
-                                "currency": txn.currency,
-                                "description": txn.description,
-                                "transaction_timestamp": (
-                                    txn.transaction_timestamp.isoformat()
-                                    if txn.transaction_timestamp
-                                    else None
-                                ),
-                                "external_source": txn.external_source,
-                            },
-                        }
+                if next_transaction_cursor:
+                    parts.append(
+                        f'\nSay "list unmatched transaction cursor '
+                        f'{next_transaction_cursor}" for more transactions.\n'
                     )
 
+                summary = "".join(parts)
+
+                # Build artifacts in one sized list per category
+                artifacts = [_unmatched_email_artifact(e) for e in unmatched_emails]
+                artifacts += [
+                    _unmatched_transaction_artifact(t) for t in unmatched_transactions
+                ]
+
             logger.info(
                 "handler.list_unmatched.success",
                 unmatched_emails_count=len(unmatched_emails),
@@ -328,6 +538,8 @@ class CommandHandlers:
                     "limit": limit,
                     "email_count": len(unmatched_emails),
                     "transaction_count": len(unmatched_transactions),
+                    "next_email_cursor": next_email_cursor,
+                    "next_transaction_cursor": next_transaction_cursor,
                 },
             }
         except Exception as exc:  # noqa: BLE001
@@ -349,9 +561,6 @@ class CommandHandlers:
         logger.info("handler.fetch_emails_now.start")
 
         try:
-            # Import here to avoid circular dependency
-            from app.emails.router import trigger_fetch
-
             result = await trigger_fetch()
 
             summary = (
@@ -365,6 +574,7 @@ class CommandHandlers:
             if result.error:
                 summary += f"\n⚠️ {result.error}"
 
+            _SUMMARY_CACHE.clear()
             logger.info("handler.fetch_emails_now.success", stored=result.emails_stored)
 
             return {
@@ -402,8 +612,6 @@ class CommandHandlers:
         logger.info("handler.fetch_transactions_now.start")
 
         try:
-            from app.transactions.router import trigger_poll
-
             result = await trigger_poll()
 
             summary = (
@@ -417,6 +625,7 @@ class CommandHandlers:
             if "warning" in result.details:
                 summary += f"\n⚠️ {result.details['warning']}"
 
+            _SUMMARY_CACHE.clear()
             logger.info("handler.fetch_transactions_now.success", run_id=result.run_id)
 
             return {
@@ -439,6 +648,47 @@ class CommandHandlers:
                 "meta": {"error": str(exc)},
             }
 
+    async def fetch_all_now(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch emails and poll transactions concurrently.
+
+        Both triggers use their own sessions and are I/O-bound (IMAP and
+        HTTP), so running them together takes as long as the slower one.
+
+        Params:
+            None
+        """
+        logger.info("handler.fetch_all_now.start")
+
+        email_result, txn_result = await asyncio.gather(
+            self.fetch_emails_now(params), self.fetch_transactions_now(params)
+        )
+
+        statuses = {email_result["status"], txn_result["status"]}
+        if statuses == {"success"}:
+            status = "success"
+        elif "success" in statuses:
+            status = "partial"
+        else:
+            status = "error"
+
+        logger.info(
+            "handler.fetch_all_now.complete",
+            status=status,
+            emails_status=email_result["status"],
+            transactions_status=txn_result["status"],
+        )
+
+        return {
+            "status": status,
+            "summary": f"{email_result['summary']}\n\n{txn_result['summary']}",
+            "artifacts": email_result["artifacts"] + txn_result["artifacts"],
+            "meta": {
+                "emails": email_result["meta"],
+                "transactions": txn_result["meta"],
+            },
+        }
+
     async def get_status(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Get system status and automation state.
@@ -449,8 +699,6 @@ class CommandHandlers:
         logger.info("handler.get_status.start")
 
         try:
-            from app.core.automation import get_automation_service
-
             automation = get_automation_service()
             status = automation.get_status()
 
@@ -505,8 +753,6 @@ class CommandHandlers:
         logger.info("handler.start_automation.start", interval=interval)
 
         try:
-            from app.core.automation import get_automation_service
-
             automation = get_automation_service()
             result = await automation.start(interval_seconds=interval)
 
@@ -544,8 +790,6 @@ class CommandHandlers:
         logger.info("handler.stop_automation.start")
 
         try:
-            from app.core.automation import get_automation_service
-
             automation = get_automation_service()
             result = await automation.stop()
 
@@ -580,7 +824,7 @@ class CommandHandlers:
         Params:
             hours (optional): Number of hours to look back (default: 24)
         """
-        hours = params.get("hours", 24)
+        hours = params.get("hours", DEFAULT_METRICS_HOURS)
 
         logger.info("handler.show_metrics.start", hours=hours)
 
@@ -625,7 +869,7 @@ class CommandHandlers:
             limit (optional): Number of log entries to return (default: 50)
             level (optional): Filter by log level (info, warning, error)
         """
-        limit = params.get("limit", 50)
+        limit = params.get("limit", DEFAULT_LOG_LIMIT)
         level = params.get("level", "all")
 
         logger.info("handler.show_logs.start", limit=limit, level=level)
@@ -733,13 +977,30 @@ class CommandHandlers:
                 "meta": {"error": str(exc)},
             }
 
-    def _build_reconciliation_artifacts(
+    def _iter_reconciliation_artifacts(
         self, batch_result: BatchMatchResult
-    ) -> List[Dict[str, Any]]:
-        """Build artifacts list from batch result."""
-        artifacts = []
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield one artifact per result in the batch."""
         for r in batch_result.results:
-            artifact = {
+            best = r.best_candidate
+            best_candidate = None
+            if best is not None:
+                best_candidate = {
+                    "transaction_id": best.transaction_id,
+                    "external_transaction_id": best.external_transaction_id,
+                    "score": best.total_score,
+                    "rule_scores": [
+                        {
+                            "rule": rs.rule_name,
+                            "score": rs.score,
+                            "weight": rs.weight,
+                            "weighted": rs.weighted_score,
+                            "details": rs.details,
+                        }
+                        for rs in best.rule_scores
+                    ],
+                }
+            yield {
                 "kind": "reconciliation_result",
                 "data": {
                     "email_id": r.email_id,
@@ -747,25 +1008,7 @@ class CommandHandlers:
                     "matched": r.matched,
                     "confidence": r.confidence,
                     "status": r.match_status,
-                    "best_candidate": (
-                        {
-                            "transaction_id": r.best_candidate.transaction_id,
-                            "external_transaction_id": r.best_candidate.external_transaction_id,
-                            "score": r.best_candidate.total_score,
-                            "rule_scores": [
-                                {
-                                    "rule": rs.rule_name,
-                                    "score": rs.score,
-                                    "weight": rs.weight,
-                                    "weighted": rs.weighted_score,
-                                    "details": rs.details,
-                                }
-                                for rs in r.best_candidate.rule_scores
-                            ],
-                        }
-                        if r.best_candidate
-                        else None
-                    ),
+                    "best_candidate": best_candidate,
                     "alternatives": [
                         {
                             "transaction_id": c.transaction_id,
@@ -773,44 +1016,101 @@ class CommandHandlers:
                             "score": c.total_score,
                             "rank": c.rank,
                         }
-                        for c in r.alternative_candidates
+                        for c in r.alternative_candidates[:MAX_ALTERNATIVES_PER_RESULT]
                     ],
                     "notes": r.notes,
                 },
             }
-            artifacts.append(artifact)
-        return artifacts
+
+    def _build_reconciliation_artifacts(
+        self, batch_result: BatchMatchResult, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Build artifacts list from batch result, keeping at most ``limit``."""
+        return list(islice(self._iter_reconciliation_artifacts(batch_result), limit))
 
 
 # Parameter extractors for command interpretation
+_LIMIT_RE = re.compile(r"\b(\d+)\b")
+_DAYS_RE = re.compile(r"\b(\d+)\s*days?\b", re.IGNORECASE)
+_REMATCH_RE = re.compile(r"\b(re-?match|re-?run|force)\b", re.IGNORECASE)
+_HOURS_RE = re.compile(r"\b(\d+)\s*hours?\b", re.IGNORECASE)
+_EMAIL_CURSOR_RE = re.compile(r"\bemails?[\s_]cursor\s+(c[0-9a-f]+)\b", re.IGNORECASE)
+_TRANSACTION_CURSOR_RE = re.compile(
+    r"\btransactions?[\s_]cursor\s+(c[0-9a-f]+)\b", re.IGNORECASE
+)
+# Substring match (no word boundaries) so plurals like "emails" still count.
+# One group per action type: the matched group's index picks the canonical
+# string, so no lowercased copy is allocated per call.
+_ACTION_TYPES = ("email", "webhook", "log", "slack", "notification")
+_ACTION_TYPE_RE = re.compile(
+    "|".join(f"({action})" for action in _ACTION_TYPES), re.IGNORECASE
+)
+_INTERVAL_RE = re.compile(
+    r"\b(\d+)\s*(seconds?|secs?|s|minutes?|mins?|m|hours?|hrs?|h)\b", re.IGNORECASE
+)
+# Seconds per interval unit, keyed by the unit's first letter
+_INTERVAL_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600}
+_BACKGROUND_RE = re.compile(
+    r"\b(in\s+(the\s+)?background|async(hronously)?)\b", re.IGNORECASE
+)
+_JOB_ID_RE = re.compile(r"\b([0-9a-f]{32})\b", re.IGNORECASE)
+
+
 def extract_limit(message: str, match: Optional[re.Match]) -> Optional[int]:
     """Extract limit parameter from message (e.g., 'reconcile 50 emails')."""
-    number_pattern = re.compile(r"\b(\d+)\b")
-    numbers = number_pattern.findall(message)
-    if numbers:
-        return int(numbers[0])
+    match_obj = _LIMIT_RE.search(message)
+    if match_obj:
+        return int(match_obj.group(1))
     return None
 
 
 def extract_days(message: str, match: Optional[re.Match]) -> int:
     """Extract days parameter from message (e.g., 'last 7 days')."""
-    number_pattern = re.compile(r"\b(\d+)\s*days?\b", re.IGNORECASE)
-    match = number_pattern.search(message)
+    match = _DAYS_RE.search(message)
     if match:
         return int(match.group(1))
-    return 7  # Default to 7 days
+    return DEFAULT_SUMMARY_DAYS
 
 
 def extract_rematch_flag(message: str, match: Optional[re.Match]) -> bool:
     """Detect if rematch/rerun is requested."""
-    rematch_pattern = re.compile(r"\b(re-?match|re-?run|force)\b", re.IGNORECASE)
-    return bool(rematch_pattern.search(message))
+    return bool(_REMATCH_RE.search(message))
+
+
+def extract_background_flag(message: str, match: Optional[re.Match]) -> bool:
+    """Detect if the work should run as a background job."""
+    return bool(_BACKGROUND_RE.search(message))
+
+
+def extract_job_id(message: str, match: Optional[re.Match]) -> Optional[str]:
+    """Extract a background job ID (e.g., 'match result 3f2a...')."""
+    match_obj = _JOB_ID_RE.search(message)
+    if match_obj:
+        return match_obj.group(1).lower()
+    return None
+
+
+def extract_email_cursor(message: str, match: Optional[re.Match]) -> Optional[str]:
+    """Extract an unmatched-email page cursor (e.g., 'email cursor ...')."""
+    match_obj = _EMAIL_CURSOR_RE.search(message)
+    if match_obj:
+        return match_obj.group(1)
+    return None
+
+
+def extract_transaction_cursor(
+    message: str, match: Optional[re.Match]
+) -> Optional[str]:
+    """Extract an unmatched-transaction page cursor (e.g., 'txn cursor ...')."""
+    match_obj = _TRANSACTION_CURSOR_RE.search(message)
+    if match_obj:
+        return match_obj.group(1)
+    return None
 
 
 def extract_hours(message: str, match: Optional[re.Match]) -> Optional[int]:
     """Extract hours parameter from message (e.g., 'last 24 hours')."""
-    hours_pattern = re.compile(r"\b(\d+)\s*hours?\b", re.IGNORECASE)
-    match_obj = hours_pattern.search(message)
+    match_obj = _HOURS_RE.search(message)
     if match_obj:
         return int(match_obj.group(1))
     return None
@@ -818,33 +1118,16 @@ def extract_hours(message: str, match: Optional[re.Match]) -> Optional[int]:
 
 def extract_action_type(message: str, match: Optional[re.Match]) -> Optional[str]:
     """Extract action type from message."""
-    # Look for known action types
-    action_types = ["email", "webhook", "log", "slack", "notification"]
-    message_lower = message.lower()
-    for action in action_types:
-        if action in message_lower:
-            return action
+    match_obj = _ACTION_TYPE_RE.search(message)
+    if match_obj and match_obj.lastindex:
+        return _ACTION_TYPES[match_obj.lastindex - 1]
     return None
 
 
 def extract_interval(message: str, match: Optional[re.Match]) -> Optional[int]:
     """Extract interval in seconds from message (e.g., '5 minutes', '300 seconds')."""
-    # Try seconds first
-    seconds_pattern = re.compile(r"\b(\d+)\s*(?:seconds?|secs?|s)\b", re.IGNORECASE)
-    match_obj = seconds_pattern.search(message)
+    match_obj = _INTERVAL_RE.search(message)
     if match_obj:
-        return int(match_obj.group(1))
-
-    # Try minutes
-    minutes_pattern = re.compile(r"\b(\d+)\s*(?:minutes?|mins?|m)\b", re.IGNORECASE)
-    match_obj = minutes_pattern.search(message)
-    if match_obj:
-        return int(match_obj.group(1)) * 60
-
-    # Try hours
-    hours_pattern = re.compile(r"\b(\d+)\s*(?:hours?|hrs?|h)\b", re.IGNORECASE)
-    match_obj = hours_pattern.search(message)
-    if match_obj:
-        return int(match_obj.group(1)) * 3600
-
+        unit = match_obj.group(2)[0].lower()
+        return int(match_obj.group(1)) * _INTERVAL_UNIT_SECONDS[unit]
     return None
@@ -9,14 +9,19 @@ LLM dependencies.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Any
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Any, Tuple
 
 import structlog
 
 
 logger = structlog.get_logger("a2a.command_interpreter")
 
+# Bounds for the interpret() result cache; longer messages are never cached
+MATCH_CACHE_SIZE = 1024
+MATCH_CACHE_MAX_MESSAGE = 512
+
 
 @dataclass
 class CommandMatch:
@@ -60,6 +65,14 @@ class CommandInterpreter:
     def __init__(self) -> None:
         self.commands: Dict[str, CommandDefinition] = {}
         self._compiled_patterns: Dict[str, List[re.Pattern]] = {}
+        # Lowercased example phrase -> (command, pattern index) that the full
+        # scan resolves it to; rebuilt lazily after registrations change.
+        self._exact_routes: Optional[Dict[str, Tuple[str, int]]] = None
+        # Every (command, pattern index, pattern) in scan order, flattened once
+        # so the scan is a single loop; rebuilt lazily after registrations.
+        self._scan_order: Optional[Tuple[Tuple[str, int, re.Pattern], ...]] = None
+        # Stripped message -> interpreted command, least recently used first
+        self._match_cache: OrderedDict[str, CommandMatch] = OrderedDict()
 
     def register_command(
         self,
@@ -87,6 +100,9 @@ class CommandInterpreter:
         self._compiled_patterns[name] = [
             re.compile(pattern, re.IGNORECASE) for pattern in patterns
         ]
+        self._exact_routes = None
+        self._scan_order = None
+        self._match_cache.clear()
 
         logger.info(
             "command.registered",
@@ -108,45 +124,60 @@ class CommandInterpreter:
         message = message.strip()
         logger.debug("command.interpret.start", message_length=len(message))
 
-        # Try each registered command
-        for cmd_name, cmd_def in self.commands.items():
-            patterns = self._compiled_patterns[cmd_name]
-
-            for i, pattern in enumerate(patterns):
-                match = pattern.search(message)
-                if match:
-                    # Extract parameters if extractors are defined
-                    params = {}
-                    if cmd_def.param_extractors:
-                        for param_name, extractor in cmd_def.param_extractors.items():
-                            try:
-                                params[param_name] = extractor(message, match)
-                            except Exception as exc:  # noqa: BLE001
-                                logger.warning(
-                                    "command.param_extraction.failed",
-                                    command=cmd_name,
-                                    param=param_name,
-                                    error=str(exc),
-                                )
-
-                    # Calculate confidence based on match quality
-                    confidence = self._calculate_confidence(match, message)
-
-                    logger.info(
-                        "command.matched",
-                        command=cmd_name,
-                        pattern_index=i,
-                        confidence=confidence,
-                        params=params,
-                    )
-
-                    return CommandMatch(
-                        command_name=cmd_name,
-                        handler=cmd_def.handler,
-                        params=params,
-                        confidence=confidence,
-                        matched_pattern=cmd_def.patterns[i],
-                    )
+        cached = self._match_cache.get(message)
+        if cached is not None:
+            self._match_cache.move_to_end(message)
+            logger.info("command.matched.cached", command=cached.command_name)
+            return replace(cached, params=dict(cached.params))
+
+        command_match = self._match(message)
+        if len(message) < MATCH_CACHE_MAX_MESSAGE:
+            self._match_cache[message] = replace(
+                command_match, params=dict(command_match.params)
+            )
+            if len(self._match_cache) > MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        return command_match
+
+    def _match(self, message: str) -> CommandMatch:
+        """Route a stripped message and extract its parameters."""
+        route = self._route(message)
+        if route is not None:
+            cmd_name, i, match = route
+            cmd_def = self.commands[cmd_name]
+
+            # Extract parameters if extractors are defined
+            params = {}
+            if cmd_def.param_extractors:
+                for param_name, extractor in cmd_def.param_extractors.items():
+                    try:
+                        params[param_name] = extractor(message, match)
+                    except Exception as exc:  # noqa: BLE001
+                        logger.warning(
+                            "command.param_extraction.failed",
+                            command=cmd_name,
+                            param=param_name,
+                            error=str(exc),
+                        )
+
+            # Calculate confidence based on match quality
+            confidence = self._calculate_confidence(match, message)
+
+            logger.info(
+                "command.matched",
+                command=cmd_name,
+                pattern_index=i,
+                confidence=confidence,
+                params=params,
+            )
+
+            return CommandMatch(
+                command_name=cmd_name,
+                handler=cmd_def.handler,
+                params=params,
+                confidence=confidence,
+                matched_pattern=cmd_def.patterns[i],
+            )
 
         # No match found - return help command
         logger.info("command.no_match", message=message)
@@ -163,6 +194,53 @@ class CommandInterpreter:
             matched_pattern="default",
         )
 
+    def _route(self, message: str) -> Optional[Tuple[str, int, re.Match]]:
+        """
+        Resolve a message to (command, pattern index, match).
+
+        Messages that are exactly one of the registered example phrases
+        (the common case in chat) are looked up in a table precomputed with
+        the full scan, so they run a single regex instead of trying every
+        pattern in turn. Everything else goes through the ordered scan.
+        """
+        if self._exact_routes is None:
+            self._exact_routes = self._build_exact_routes()
+
+        route = self._exact_routes.get(message.lower())
+        if route is not None:
+            cmd_name, i = route
+            match = self._compiled_patterns[cmd_name][i].search(message)
+            if match:
+                return cmd_name, i, match
+
+        return self._scan(message)
+
+    def _scan(self, message: str) -> Optional[Tuple[str, int, re.Match]]:
+        """Try each registered command's patterns in registration order."""
+        if self._scan_order is None:
+            self._scan_order = tuple(
+                (cmd_name, i, pattern)
+                for cmd_name, patterns in self._compiled_patterns.items()
+                for i, pattern in enumerate(patterns)
+            )
+
+        for cmd_name, i, pattern in self._scan_order:
+            match = pattern.search(message)
+            if match:
+                return cmd_name, i, match
+        return None
+
+    def _build_exact_routes(self) -> Dict[str, Tuple[str, int]]:
+        """Map each example phrase to the route the ordered scan picks."""
+        routes: Dict[str, Tuple[str, int]] = {}
+        for cmd_def in self.commands.values():
+            for example in cmd_def.examples:
+                example = example.strip()
+                route = self._scan(example)
+                if route is not None:
+                    routes[example.lower()] = (route[0], route[1])
+        return routes
+
     def _calculate_confidence(self, match: re.Match, message: str) -> float:
         """
         Calculate confidence score based on match quality.
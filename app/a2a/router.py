@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, Optional, List
 
+import orjson
 import structlog
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi import Request
@@ -24,6 +27,10 @@ from app.a2a.command_handlers import (
     extract_days,
     extract_rematch_flag,
     extract_interval,
+    extract_background_flag,
+    extract_job_id,
+    extract_email_cursor,
+    extract_transaction_cursor,
 )
 
 
@@ -54,7 +61,27 @@ def _init_command_interpreter() -> None:
             "run matching",
             "process alerts",
         ],
-        param_extractors={"limit": extract_limit, "rematch": extract_rematch_flag},
+        param_extractors={
+            "limit": extract_limit,
+            "rematch": extract_rematch_flag,
+            "background": extract_background_flag,
+        },
+    )
+
+    # Register: match_result
+    interpreter.register_command(
+        name="match_result",
+        patterns=[
+            r"\bmatch(ing)?\s+(job|result)s?\s+[0-9a-f]{32}\b",
+            r"\bjob\s+[0-9a-f]{32}\b",
+        ],
+        handler=None,
+        description="Check on a background matching job",
+        examples=[
+            "match result <job id>",
+            "matching job <job id>",
+        ],
+        param_extractors={"job_id": extract_job_id},
     )
 
     # Register: show_summary
@@ -93,7 +120,28 @@ def _init_command_interpreter() -> None:
             "show unmatched transactions",
             "pending alerts",
         ],
-        param_extractors={"limit": extract_limit},
+        param_extractors={
+            "limit": extract_limit,
+            "email_cursor": extract_email_cursor,
+            "transaction_cursor": extract_transaction_cursor,
+        },
+    )
+
+    # Register: fetch_all_now (before the single-source fetch commands)
+    interpreter.register_command(
+        name="fetch_all_now",
+        patterns=[
+            r"\b(fetch|pull|sync)\s+everything\b",
+            r"\b(fetch|get|pull|check)\s+(all\s+)?(new\s+)?(emails?|alerts?)\s+and\s+"
+            r"((fetch|get|pull|poll)\s+)?(new\s+)?transactions?\b",
+        ],
+        handler=None,
+        description="Fetch new emails and transactions at the same time",
+        examples=[
+            "fetch everything",
+            "fetch all emails and transactions",
+            "fetch new emails and poll transactions",
+        ],
     )
 
     # Register: fetch_emails_now (renamed from fetch_emails)
@@ -279,6 +327,39 @@ logger = structlog.get_logger("a2a")
 router = APIRouter()
 
 
+def _orjson_default(obj: Any) -> Any:
+    """Encode types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        # Emit the exact decimal digits as a JSON number (no float rounding)
+        return orjson.Fragment(str(obj))
+    raise TypeError
+
+
+def _orjson_dumps(content: Any) -> bytes:
+    """Encode content exactly as A2A responses are rendered."""
+    return orjson.dumps(
+        content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+    )
+
+
+def _json_fragment(content: Any) -> orjson.Fragment:
+    """
+    Pre-encode a large payload (e.g. artifacts) for a MessagePart.
+
+    model_dump() passes the fragment through untouched and orjson writes its
+    bytes as-is, so the artifact tree is walked once instead of being copied
+    by model_dump() and then encoded.
+    """
+    return orjson.Fragment(_orjson_dumps(content))
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return _orjson_dumps(content)
+
+
 class JSONRPCError(BaseModel):
     code: int
     message: str
@@ -345,8 +426,33 @@ def _method_not_implemented(id_: Optional[str | int], method: str) -> JSONRPCRes
     )
 
 
+@lru_cache(maxsize=32)
+def _status_message(agent_name: str) -> Message:
+    """Build the (static) status message for an agent name once."""
+    settings = get_settings()
+
+    status_text = "🟢 **BARA Service is healthy**\n\n"
+    status_text += f"**Agent:** {agent_name}\n"
+    status_text += f"**Environment:** {settings.ENV}\n"
+    status_text += f"**Configured Agent:** {settings.A2A_AGENT_NAME}\n"
+
+    return Message(
+        parts=[
+            MessagePart(kind="text", text=status_text),
+            MessagePart(
+                kind="data",
+                data={
+                    "agent": agent_name,
+                    "configured_agent": settings.A2A_AGENT_NAME,
+                    "env": settings.ENV,
+                },
+            ),
+        ]
+    )
+
+
 @router.post("/a2a/agent/{agent_name}")
-async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Depends(get_db)) -> JSONResponse:  # type: ignore[no-untyped-def]
+async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Depends(get_db)) -> ORJSONResponse:  # type: ignore[no-untyped-def]
     """Generic A2A JSON-RPC endpoint that validates method and returns a JSON-RPC response.
 
     Supported methods:
@@ -359,8 +465,8 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
     )
 
     try:
-        # Parse JSON body
-        payload = await request.json()
+        # Parse JSON body (orjson decodes the raw bytes directly)
+        payload = orjson.loads(await request.body())
         logger.debug("a2a.request.parsed", payload_keys=list(payload.keys()))
     except Exception as exc:  # noqa: BLE001
         logger.error("a2a.request.invalid_json", error=str(exc))
@@ -372,7 +478,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
         logger.info("a2a.request.validated", method=req.method, request_id=req.id)
     except Exception as exc:  # noqa: BLE001
         logger.warning("a2a.request.validation_failed", error=str(exc), payload=payload)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content=JSONRPCResponse(
                 id=payload.get("id"),
@@ -383,7 +489,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
     # Validate jsonrpc version
     if req.jsonrpc != "2.0":
         logger.warning("a2a.request.wrong_version", version=req.jsonrpc, expected="2.0")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content=JSONRPCResponse(
                 id=req.id,
@@ -401,7 +507,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
             # Interpret the command
             interpreter = get_interpreter()
             # Use robust extraction for user text
-            user_text = interpreter.extract_text(req.model_dump())
+            user_text = interpreter.extract_text({"params": req.params})
             if user_text:
                 logger.info("a2a.natural_language.detected", text_length=len(user_text))
                 command_match = interpreter.interpret(user_text)
@@ -427,7 +533,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                         ]
                     )
                     resp = JSONRPCResponse(id=req.id, result=result)
-                    return JSONResponse(status_code=200, content=resp.model_dump())
+                    return ORJSONResponse(status_code=200, content=resp.model_dump())
                 # Execute the matched command
                 try:
                     handlers = CommandHandlers(db)
@@ -446,7 +552,10 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                     # Add artifacts as data
                     if result_data.get("artifacts"):
                         message_parts.append(
-                            MessagePart(kind="data", data=result_data["artifacts"])
+                            MessagePart(
+                                kind="data",
+                                data=_json_fragment(result_data["artifacts"]),
+                            )
                         )
 
                     # Add metadata
@@ -465,14 +574,14 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                         command=command_match.command_name,
                         status=result_data.get("status"),
                     )
-                    return JSONResponse(status_code=200, content=resp.model_dump())
+                    return ORJSONResponse(status_code=200, content=resp.model_dump())
                 except Exception as exc:  # noqa: BLE001
                     logger.exception(
                         "a2a.natural_language.error",
                         command=command_match.command_name,
                         error=str(exc),
                     )
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=200,
                         content=JSONRPCResponse(
                             id=req.id,
@@ -487,31 +596,15 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
     # STATUS METHOD -----------------------------------------------------------------
     if req.method == "status":
         logger.info("a2a.status.start", request_id=req.id, agent=agent_name)
-        settings = get_settings()
-
-        status_text = "🟢 **BARA Service is healthy**\n\n"
-        status_text += f"**Agent:** {agent_name}\n"
-        status_text += f"**Environment:** {settings.ENV}\n"
-        status_text += f"**Configured Agent:** {settings.A2A_AGENT_NAME}\n"
-
-        result = Message(
-            parts=[
-                MessagePart(kind="text", text=status_text),
-                MessagePart(
-                    kind="data",
-                    data={
-                        "agent": agent_name,
-                        "configured_agent": settings.A2A_AGENT_NAME,
-                        "env": settings.ENV,
-                    },
-                ),
-            ]
-        )
-        resp = JSONRPCResponse(id=req.id, result=result)
+        status_message = _status_message(agent_name)
         logger.info(
-            "a2a.status.success", request_id=req.id, agent=agent_name, env=settings.ENV
+            "a2a.status.success",
+            request_id=req.id,
+            agent=agent_name,
+            env=get_settings().ENV,
         )
-        return JSONResponse(status_code=200, content=resp.model_dump())
+        resp = JSONRPCResponse(id=req.id, result=status_message)
+        return ORJSONResponse(status_code=200, content=resp.model_dump())
 
     # MESSAGE/SEND (ON-DEMAND RECONCILIATION) ---------------------------------------
     if req.method == "message/send":
@@ -543,7 +636,12 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                     count=len(email_ids),
                 )
                 engine = MatchingEngine(db)
-                match_repo = MatchRepository(Match, db)
+                email_repo = EmailRepository.for_session(Email, db)
+                match_repo = MatchRepository.for_session(Match, db)
+                if not rematch:
+                    # Resolve existence and prior matches for all IDs up front
+                    existing_ids = await email_repo.get_existing_ids(email_ids)
+                    matched_ids = await match_repo.get_email_ids_with_match(email_ids)
                 results: List[MatchResult] = []
                 for eid in email_ids:
                     logger.debug(
@@ -557,10 +655,8 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                             status=res.match_status,
                         )
                     else:
-                        # Fetch email and match only if no existing match
-                        repo = EmailRepository(Email, db)
-                        email_model = await repo.get_by_id(eid)
-                        if not email_model:
+                        # Match only existing emails without an existing match
+                        if eid not in existing_ids:
                             # Skip non-existent email IDs
                             logger.warning(
                                 "a2a.reconcile.email_not_found",
@@ -568,13 +664,13 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                                 request_id=req.id,
                             )
                             continue
-                        # Check if match already exists using repository
-                        if await match_repo.exists_for_email(eid):
+                        if eid in matched_ids:
                             logger.debug(
                                 "a2a.reconcile.email_already_matched", email_id=eid
                             )
                             continue
                         res = await engine.rematch_email(eid)
+                        matched_ids.add(eid)
                         logger.info(
                             "a2a.reconcile.email_matched",
                             email_id=eid,
@@ -664,7 +760,9 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
 
             # Add artifacts as structured data
             if result_artifacts:
-                message_parts.append(MessagePart(kind="data", data=result_artifacts))
+                message_parts.append(
+                    MessagePart(kind="data", data=_json_fragment(result_artifacts))
+                )
 
             # Create metadata
             metadata = {
@@ -684,7 +782,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                 no_candidates=batch_result.total_no_candidates,
                 avg_confidence=batch_result.average_confidence,
             )
-            return JSONResponse(status_code=200, content=resp.model_dump())
+            return ORJSONResponse(status_code=200, content=resp.model_dump())
         except Exception as exc:  # noqa: BLE001
             logger.exception(
                 "a2a.reconcile.error",
@@ -692,7 +790,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                 error=str(exc),
                 error_type=type(exc).__name__,
             )
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content=JSONRPCResponse(
                     id=req.id,
@@ -739,7 +837,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                         ]
                     )
                     resp = JSONRPCResponse(id=req.id, result=result)
-                    return JSONResponse(status_code=200, content=resp.model_dump())
+                    return ORJSONResponse(status_code=200, content=resp.model_dump())
 
                 # Update configuration if provided
                 if interval:
@@ -762,7 +860,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                 )
                 resp = JSONRPCResponse(id=req.id, result=result)
                 logger.info("a2a.execute.automation_started", request_id=req.id)
-                return JSONResponse(status_code=200, content=resp.model_dump())
+                return ORJSONResponse(status_code=200, content=resp.model_dump())
 
             elif action == "stop_automation":
                 # Stop background automation
@@ -779,7 +877,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                         ]
                     )
                     resp = JSONRPCResponse(id=req.id, result=result)
-                    return JSONResponse(status_code=200, content=resp.model_dump())
+                    return ORJSONResponse(status_code=200, content=resp.model_dump())
 
                 await automation.stop()
 
@@ -796,7 +894,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                 )
                 resp = JSONRPCResponse(id=req.id, result=result)
                 logger.info("a2a.execute.automation_stopped", request_id=req.id)
-                return JSONResponse(status_code=200, content=resp.model_dump())
+                return ORJSONResponse(status_code=200, content=resp.model_dump())
 
             elif action == "automation_status":
                 # Get automation status
@@ -833,7 +931,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                     request_id=req.id,
                     running=status["running"],
                 )
-                return JSONResponse(status_code=200, content=resp.model_dump())
+                return ORJSONResponse(status_code=200, content=resp.model_dump())
 
             elif action == "run_once":
                 # Manually trigger one reconciliation cycle
@@ -887,14 +985,14 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                 logger.info(
                     "a2a.execute.run_once_complete", request_id=req.id, success=success
                 )
-                return JSONResponse(status_code=200, content=resp.model_dump())
+                return ORJSONResponse(status_code=200, content=resp.model_dump())
 
             else:
                 # Unknown action - return error
                 logger.warning(
                     "a2a.execute.unknown_action", action=action, request_id=req.id
                 )
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=200,
                     content=JSONRPCResponse(
                         id=req.id,
@@ -920,7 +1018,7 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
                 action=action,
                 error=str(exc),
             )
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content=JSONRPCResponse(
                     id=req.id,
@@ -935,4 +1033,4 @@ async def a2a_endpoint(request: Request, agent_name: str, db: AsyncSession = Dep
     # For message/send and execute (and anything else), respond as not implemented
     logger.warning("a2a.method.not_implemented", method=req.method, request_id=req.id)
     not_impl = _method_not_implemented(req.id, req.method)
-    return JSONResponse(status_code=200, content=not_impl.model_dump())
+    return ORJSONResponse(status_code=200, content=not_impl.model_dump())
@@ -17,6 +17,9 @@ class Base(DeclarativeBase):
 
 
 # Create async engine
+# Pool sizing follows the usual (cores * 2) + 1 rule of thumb for a small
+# API host; connections are recycled before managed Postgres idle timeouts
+# and checkouts fail fast instead of queueing A2A requests behind the pool.
 engine = create_async_engine(
     settings.DATABASE_URL or "sqlite+aiosqlite:///./bankagent.db",
     echo=settings.DEBUG,
@@ -24,6 +27,8 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    pool_recycle=1800,
+    pool_timeout=5,
 )
 
 # Create async session factory
@@ -2,6 +2,7 @@
 
 import asyncio
 import re
+from contextlib import AsyncExitStack
 from app.db.base import engine, Base
 from app.core.config import get_settings
 import structlog
@@ -71,6 +72,28 @@ async def reset_database():
     logger.warning("   Stop the uvicorn/FastAPI server and restart it.")
 
 
+async def warm_connection_pool() -> int:
+    """
+    Open the pool's base connections up front.
+
+    Holding every connection open at once forces the pool to establish
+    pool_size distinct connections, so the first A2A requests after a
+    deploy reuse warm connections instead of paying connect/TLS/auth.
+
+    Returns:
+        Number of connections opened
+    """
+    size_fn = getattr(engine.pool, "size", None)
+    size = size_fn() if callable(size_fn) else 1
+
+    async with AsyncExitStack() as stack:
+        for _ in range(size):
+            await stack.enter_async_context(engine.connect())
+
+    logger.info("Database connection pool warmed", connections=size)
+    return size
+
+
 if __name__ == "__main__":
     import sys
 
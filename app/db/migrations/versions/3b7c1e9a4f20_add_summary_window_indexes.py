@@ -0,0 +1,36 @@
+"""add_summary_window_indexes
+
+Revision ID: 3b7c1e9a4f20
+Revises: fe83cc6ad3ec
+Create Date: 2026-10-16 11:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7c1e9a4f20"
+down_revision: Union[str, None] = "fe83cc6ad3ec"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index created_at windows used by the summary and unmatched listings."""
+    op.create_index(
+        "idx_match_created_status", "matches", ["created_at", "status"], unique=False
+    )
+    op.create_index("idx_email_created_at", "emails", ["created_at"], unique=False)
+    op.create_index(
+        "idx_transaction_created_at", "transactions", ["created_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop the created_at window indexes."""
+    op.drop_index("idx_transaction_created_at", table_name="transactions")
+    op.drop_index("idx_email_created_at", table_name="emails")
+    op.drop_index("idx_match_created_status", table_name="matches")
@@ -120,6 +120,7 @@ class Email(Base):
     __table_args__ = (
         Index("idx_email_amount_timestamp", "amount", "email_timestamp"),
         Index("idx_email_processed", "is_processed", "parsed_at"),
+        Index("idx_email_created_at", "created_at"),
     )
 
     def __repr__(self) -> str:
@@ -113,6 +113,7 @@ class Match(Base):
         Index("idx_match_email_transaction", "email_id", "transaction_id"),
         Index("idx_match_confidence", "matched", "confidence"),
         Index("idx_match_status", "status", "matched_at"),
+        Index("idx_match_created_status", "created_at", "status"),
     )
 
     def __repr__(self) -> str:
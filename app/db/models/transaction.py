@@ -129,6 +129,7 @@ class Transaction(Base):
         Index("idx_transaction_amount_timestamp", "amount", "transaction_timestamp"),
         Index("idx_transaction_verified", "is_verified", "status"),
         Index("idx_transaction_source_status", "external_source", "status"),
+        Index("idx_transaction_created_at", "created_at"),
     )
 
     def __repr__(self) -> str:
@@ -1,10 +1,11 @@
 """Email repository with specialized queries."""
 
 from datetime import datetime, timedelta
-from typing import Optional, List
-from sqlalchemy import select, and_
+from typing import Iterable, Optional, List, Set, Tuple
+from sqlalchemy import Row, select, and_, exists, tuple_
 
 from app.db.models.email import Email
+from app.db.models.match import Match
 from app.db.repository import BaseRepository
 
 
@@ -15,6 +16,20 @@ class EmailRepository(BaseRepository[Email]):
         """Get an email by its message ID."""
         return await self.get_by_field("message_id", message_id)
 
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        """
+        Get which of the given email IDs exist.
+
+        Args:
+            ids: Email IDs to check
+
+        Returns:
+            Subset of ids that have an email record
+        """
+        query = select(self.model.id).where(self.model.id.in_(ids))
+        result = await self.session.execute(query)
+        return set(result.scalars().all())
+
     async def get_unprocessed(self, limit: Optional[int] = None) -> List[Email]:
         """
         Get unprocessed emails.
@@ -111,12 +126,9 @@ class EmailRepository(BaseRepository[Email]):
         Returns:
             List of unmatched emails
         """
-        from app.db.models.match import Match
-
         query = (
             select(self.model)
-            .outerjoin(Match, self.model.id == Match.email_id)
-            .where(Match.id.is_(None))  # Only emails without a match record
+            .where(~exists().where(Match.email_id == self.model.id))  # No match record
             .order_by(self.model.created_at.desc())
         )
         if limit:
@@ -125,6 +137,50 @@ class EmailRepository(BaseRepository[Email]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def list_unmatched(
+        self, limit: int, before: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
+        """
+        List the most recent emails that have no match record.
+
+        Uses a NOT EXISTS anti-join so the database can plan a semi-join
+        instead of receiving the matched IDs back as an IN (...) list.
+
+        Args:
+            limit: Maximum number of emails to return
+            before: Keyset cursor of (created_at, id); only return emails
+                ordered after that row
+
+        Returns:
+            Rows of the listed email columns for unmatched emails, newest first
+        """
+        # Project only the columns the unmatched listing renders; rows skip
+        # ORM hydration and identity-map bookkeeping.
+        query = (
+            select(
+                self.model.id,
+                self.model.sender,
+                self.model.subject,
+                self.model.amount,
+                self.model.currency,
+                self.model.reference,
+                self.model.received_at,
+                self.model.parsed_at,
+                self.model.created_at,
+            )
+            .where(~exists().where(Match.email_id == self.model.id))
+            .order_by(self.model.created_at.desc(), self.model.id.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            # id breaks created_at ties so rows sharing a timestamp at a page
+            # boundary are neither skipped nor repeated
+            query = query.where(
+                tuple_(self.model.created_at, self.model.id) < tuple_(*before)
+            )
+        result = await self.session.execute(query)
+        return list(result.all())
+
     async def count_unprocessed(self) -> int:
         """Get count of unprocessed emails."""
         return await self.count(is_processed=False)
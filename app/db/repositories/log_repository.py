@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, delete
 
 from app.db.models.log import Log
 from app.db.repository import BaseRepository
@@ -205,8 +205,6 @@ class LogRepository(BaseRepository[Log]):
         Returns:
             Number of deleted records
         """
-        from sqlalchemy import delete
-
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         result = await self.session.execute(
             delete(self.model).where(self.model.timestamp < cutoff)
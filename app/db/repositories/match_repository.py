@@ -1,10 +1,12 @@
 """Match repository with specialized queries."""
 
 from datetime import datetime, timezone
-from typing import Optional, List
-from sqlalchemy import select, desc
+from typing import Iterable, Optional, List, Set
+from sqlalchemy import select, desc, func, case
 
+from app.db.models.email import Email
 from app.db.models.match import Match
+from app.db.models.transaction import Transaction
 from app.db.repository import BaseRepository
 
 
@@ -27,6 +29,22 @@ class MatchRepository(BaseRepository[Match]):
         """
         return await self.exists(email_id=email_id)
 
+    async def get_email_ids_with_match(self, email_ids: Iterable[int]) -> Set[int]:
+        """
+        Get which of the given emails already have a match.
+
+        One IN query instead of an exists_for_email() round-trip per email.
+
+        Args:
+            email_ids: Email IDs to check
+
+        Returns:
+            Subset of email_ids that have a match record
+        """
+        query = select(self.model.email_id).where(self.model.email_id.in_(email_ids))
+        result = await self.session.execute(query)
+        return set(result.scalars().all())
+
     async def get_by_transaction_id(self, transaction_id: int) -> List[Match]:
         """
         Get all matches for a transaction.
@@ -123,6 +141,45 @@ class MatchRepository(BaseRepository[Match]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_summary_counts(self, since: datetime) -> dict:
+        """
+        Get email, transaction and match status counts in a single query.
+
+        All counts are computed in one round-trip: email and transaction
+        totals as scalar subqueries, match totals as conditional aggregates.
+
+        Args:
+            since: Only count records created at or after this timestamp
+
+        Returns:
+            Dictionary with email, transaction, match and per-status counts
+        """
+        email_count = (
+            select(func.count(Email.id))
+            .where(Email.created_at >= since)
+            .scalar_subquery()
+        )
+        transaction_count = (
+            select(func.count(Transaction.id))
+            .where(Transaction.created_at >= since)
+            .scalar_subquery()
+        )
+        status = self.model.status
+
+        query = select(
+            email_count.label("emails"),
+            transaction_count.label("transactions"),
+            func.count().label("matches"),
+            func.count(case((status == "matched", 1))).label("matched"),
+            func.count(case((status == "review", 1))).label("review"),
+            func.count(case((status == "rejected", 1))).label("rejected"),
+            func.count(case((status == "no_candidates", 1))).label("no_candidates"),
+        ).where(self.model.created_at >= since)
+
+        result = await self.session.execute(query)
+        row = result.one()
+        return {key: value or 0 for key, value in row._mapping.items()}
+
     async def get_pending_review(self, limit: Optional[int] = None) -> List[Match]:
         """
         Get matches pending manual review.
@@ -215,33 +272,52 @@ class MatchRepository(BaseRepository[Match]):
         """Get count of unmatched records."""
         return await self.count(matched=False)
 
-    async def get_match_statistics(self) -> dict:
+    async def get_match_statistics(self, since: Optional[datetime] = None) -> dict:
         """
         Get matching statistics.
 
-        Returns:
-            Dictionary with match counts and averages
-        """
-        from sqlalchemy import func
+        Counts, average confidence and the confidence distribution are
+        aggregated in a single query instead of loading match rows.
 
-        # Count queries
-        total = await self.count()
-        matched = await self.count_matched()
-        unmatched = await self.count_unmatched()
-        pending_review = await self.count(status="review")
+        Args:
+            since: Only include matches created at or after this timestamp
 
-        # Average confidence
-        avg_query = select(func.avg(self.model.confidence)).where(
-            self.model.matched.is_(True)
+        Returns:
+            Dictionary with match counts, averages and confidence buckets
+        """
+        matched_flag = self.model.matched
+        confidence = self.model.confidence
+
+        query = select(
+            func.count(self.model.id).label("total"),
+            func.count(case((matched_flag.is_(True), 1))).label("matched"),
+            func.count(case((matched_flag.is_(False), 1))).label("unmatched"),
+            func.count(case((self.model.status == "review", 1))).label("review"),
+            func.avg(case((matched_flag.is_(True), confidence))).label("avg"),
+            func.count(case((confidence >= 0.8, 1))).label("high"),
+            func.count(case(((confidence >= 0.5) & (confidence < 0.8), 1))).label(
+                "medium"
+            ),
+            func.count(case((confidence < 0.5, 1))).label("low"),
         )
-        result = await self.session.execute(avg_query)
-        avg_confidence = result.scalar() or 0.0
+        if since is not None:
+            query = query.where(self.model.created_at >= since)
+
+        result = await self.session.execute(query)
+        row = result.one()
+        total = row.total or 0
+        matched = row.matched or 0
 
         return {
             "total": total,
             "matched": matched,
-            "unmatched": unmatched,
-            "pending_review": pending_review,
-            "average_confidence": float(avg_confidence),
+            "unmatched": row.unmatched or 0,
+            "pending_review": row.review or 0,
+            "average_confidence": float(row.avg or 0.0),
             "match_rate": (matched / total * 100) if total > 0 else 0.0,
+            "confidence_distribution": {
+                "high": row.high or 0,
+                "medium": row.medium or 0,
+                "low": row.low or 0,
+            },
         }
@@ -1,10 +1,11 @@
 """Transaction repository with specialized queries."""
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from decimal import Decimal
-from sqlalchemy import select, and_
+from sqlalchemy import Row, select, and_, exists, tuple_
 
+from app.db.models.match import Match
 from app.db.models.transaction import Transaction
 from app.db.repository import BaseRepository
 
@@ -137,6 +138,50 @@ class TransactionRepository(BaseRepository[Transaction]):
         """Get count of unverified transactions."""
         return await self.count(is_verified=False)
 
+    async def list_unmatched(
+        self, limit: int, before: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
+        """
+        List the most recent transactions not referenced by any match.
+
+        Uses a NOT EXISTS anti-join so the database can plan a semi-join
+        instead of receiving the matched IDs back as an IN (...) list.
+
+        Args:
+            limit: Maximum number of transactions to return
+            before: Keyset cursor of (created_at, id); only return transactions
+                ordered after that row
+
+        Returns:
+            Rows of the listed transaction columns for unmatched transactions,
+            newest first
+        """
+        # Project only the columns the unmatched listing renders; rows skip
+        # ORM hydration and identity-map bookkeeping.
+        query = (
+            select(
+                self.model.id,
+                self.model.reference,
+                self.model.amount,
+                self.model.currency,
+                self.model.description,
+                self.model.transaction_timestamp,
+                self.model.external_source,
+                self.model.created_at,
+            )
+            .where(~exists().where(Match.transaction_id == self.model.id))
+            .order_by(self.model.created_at.desc(), self.model.id.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            # id breaks created_at ties so rows sharing a timestamp at a page
+            # boundary are neither skipped nor repeated
+            query = query.where(
+                tuple_(self.model.created_at, self.model.id) < tuple_(*before)
+            )
+        result = await self.session.execute(query)
+        return list(result.all())
+
     async def count_by_status(self, status: str) -> int:
         """Get count of transactions with specific status."""
         return await self.count(status=status)
@@ -166,8 +211,6 @@ class TransactionRepository(BaseRepository[Transaction]):
         Returns:
             List of candidate transactions
         """
-        from app.db.models.match import Match
-
         query = select(self.model)
         conditions = []
 
@@ -188,14 +231,15 @@ class TransactionRepository(BaseRepository[Transaction]):
             conditions.append(self.model.transaction_timestamp >= start_time)
             conditions.append(self.model.transaction_timestamp <= end_time)
 
-        # Exclude already matched transactions
+        # Exclude already matched transactions (correlated NOT EXISTS, so the
+        # database can plan an anti-join instead of hashing a NOT IN list)
         if exclude_already_matched:
-            matched_subquery = (
-                select(Match.transaction_id)
-                .where(Match.matched.is_(True))
-                .where(Match.transaction_id.isnot(None))
+            conditions.append(
+                ~exists().where(
+                    Match.transaction_id == self.model.id,
+                    Match.matched.is_(True),
+                )
             )
-            conditions.append(self.model.id.notin_(matched_subquery))
 
         # Apply all conditions
         if conditions:
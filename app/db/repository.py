@@ -1,7 +1,7 @@
 """Base repository class with common CRUD operations."""
 
 from typing import Generic, TypeVar, Type, Optional, List, Any
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base import Base
@@ -28,6 +28,28 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.session = session
 
+    @classmethod
+    def for_session(cls, model: Type[ModelType], session: AsyncSession):
+        """
+        Get a repository bound to a session, reusing one cached on the session.
+
+        The instance is stored in ``session.info`` so callers that share a
+        session (handlers, engine, routers) share one repository per model.
+
+        Args:
+            model: SQLAlchemy model class
+            session: Async database session
+
+        Returns:
+            Repository instance bound to the session
+        """
+        cache = session.info.setdefault("repositories", {})
+        key = (cls, model)
+        repo = cache.get(key)
+        if repo is None:
+            repo = cache[key] = cls(model, session)
+        return repo
+
     async def create(self, **kwargs) -> ModelType:
         """
         Create a new record.
@@ -295,9 +317,9 @@ class BaseRepository(Generic[ModelType]):
             # Count logs older than cutoff date
             await repo.count(timestamp__lt=cutoff_date)
         """
-        from sqlalchemy import func
-
-        query = select(func.count(self.model.id))  # type: ignore
+        # COUNT(*) rather than COUNT(id): no column has to be read, so the
+        # planner can answer from whichever index covers the filters.
+        query = select(func.count()).select_from(self.model)
         query = self._apply_filters(query, filters)
 
         result = await self.session.execute(query)
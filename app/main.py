@@ -10,6 +10,8 @@ from app.core.automation import get_automation_service
 from app.core.automation_router import router as automation_router
 from app.core.config import get_settings
 from app.core.logging import configure_logging, request_id_middleware
+from app.db.base import engine
+from app.db.init import warm_connection_pool
 from app.emails.config import EmailConfig
 from app.emails.fetcher import EmailFetcher
 from app.emails.router import router as emails_router
@@ -34,6 +36,12 @@ async def lifespan(app: FastAPI):
     )
     logger.info("=" * 70)
 
+    # Establish pooled DB connections before the first request needs them
+    try:
+        await warm_connection_pool()
+    except Exception as e:
+        logger.warning(f"⚠ Database pool warmup skipped: {e}")
+
     # Initialize email fetcher if IMAP is configured
     if all([settings.IMAP_HOST, settings.IMAP_USER, settings.IMAP_PASS]):
         try:
@@ -80,6 +88,9 @@ async def lifespan(app: FastAPI):
         await _fetcher.stop()
         logger.info("✓ Email fetcher stopped")
 
+    # Close pooled DB connections
+    await engine.dispose()
+
     logger.info("=" * 70)
     logger.info("✓ BARA shutdown complete")
     logger.info("=" * 70)
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import TYPE_CHECKING, Sequence
+from decimal import Decimal
+from typing import Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.email import Email
 from app.db.models.match import Match
+from app.db.models.transaction import Transaction
 from app.db.repositories.email_repository import EmailRepository
 from app.db.repositories.match_repository import MatchRepository
+from app.db.repositories.transaction_repository import TransactionRepository
+from app.emails.models import ParsedEmail
 from app.matching.config import MatchingConfig
 from app.matching.models import MatchResult, BatchMatchResult
 from app.matching.retrieval import CandidateRetriever
@@ -19,11 +24,13 @@ from app.matching.scorer import MatchScorer
 from app.normalization.models import NormalizedEmail
 from app.normalization.normalizer import normalize_email
 
-if TYPE_CHECKING:
-    from app.emails.models import ParsedEmail
-
 logger = logging.getLogger(__name__)
 
+# Serializes batch matching runs in this process. matches.email_id is not
+# unique, so overlapping runs could record an email twice or give one
+# transaction to two emails.
+_BATCH_MATCH_LOCK = asyncio.Lock()
+
 
 class MatchingEngine:
     """
@@ -57,10 +64,6 @@ class MatchingEngine:
         self.scorer = MatchScorer(config)
 
         # Initialize repositories
-        from app.db.models.match import Match
-        from app.db.models.transaction import Transaction
-        from app.db.repositories.transaction_repository import TransactionRepository
-
         self.email_repo = EmailRepository(Email, self.session)
         self.match_repo = MatchRepository(Match, self.session)
         self.transaction_repo = TransactionRepository(Transaction, self.session)
@@ -87,9 +90,7 @@ class MatchingEngine:
         # Normalize if needed
         if not isinstance(email, NormalizedEmail):
             logger.info(f"[MATCH] Normalizing email: {email.message_id}")
-            from app.emails.models import ParsedEmail as PE
-
-            if isinstance(email, PE):
+            if isinstance(email, ParsedEmail):
                 normalized_email = normalize_email(email)
             else:
                 raise ValueError(f"Unsupported email type: {type(email)}")
@@ -280,15 +281,12 @@ class MatchingEngine:
         for email in emails:
             try:
                 # Create ParsedEmail from database model
-                from app.emails.models import ParsedEmail as PE
-                from decimal import Decimal
-
                 # Validate parsing_method
                 parsing_method = email.parsing_method or "regex"
                 if parsing_method not in ("regex", "llm", "hybrid"):
                     parsing_method = "regex"
 
-                parsed = PE(
+                parsed = ParsedEmail(
                     message_id=email.message_id,
                     sender=email.sender,
                     subject=email.subject,
@@ -342,15 +340,12 @@ class MatchingEngine:
             logger.debug(f"[REMATCH] No existing match found for email {email_db_id}")
 
         # Create parsed email
-        from app.emails.models import ParsedEmail as PE
-        from decimal import Decimal
-
         # Validate parsing_method
         parsing_method = email.parsing_method or "regex"
         if parsing_method not in ("regex", "llm", "hybrid"):
             parsing_method = "regex"
 
-        parsed = PE(
+        parsed = ParsedEmail(
             message_id=email.message_id,
             sender=email.sender,
             subject=email.subject,
@@ -523,6 +518,9 @@ async def match_unmatched(
     """
     Convenience function to match all unmatched emails.
 
+    Runs one batch at a time; a call made while another batch is in
+    progress waits for it to finish.
+
     Args:
         session: Database session
         limit: Maximum number to process
@@ -531,5 +529,6 @@ async def match_unmatched(
     Returns:
         Batch match result
     """
-    engine = MatchingEngine(session, config)
-    return await engine.match_unmatched_emails(limit)
+    async with _BATCH_MATCH_LOCK:
+        engine = MatchingEngine(session, config)
+        return await engine.match_unmatched_emails(limit)
@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class RuleScore(BaseModel):
@@ -193,13 +193,19 @@ class BatchMatchResult(BaseModel):
         default=None, description="When batch completed"
     )
 
+    # Running sums so finalize() does not walk results again
+    _matched_confidence_sum: float = PrivateAttr(default=0.0)
+    _total_candidates: int = PrivateAttr(default=0)
+
     def add_result(self, result: MatchResult) -> None:
         """Add a match result and update statistics."""
         self.results.append(result)
         self.total_emails += 1
+        self._total_candidates += result.total_candidates_retrieved
 
         if result.matched:
             self.total_matched += 1
+            self._matched_confidence_sum += result.confidence
 
         if result.match_status == "needs_review":
             self.total_needs_review += 1
@@ -213,15 +219,14 @@ class BatchMatchResult(BaseModel):
         self.completed_at = datetime.now(timezone.utc)
 
         if self.total_emails > 0:
-            matched_confidences = [r.confidence for r in self.results if r.matched]
             self.average_confidence = (
-                sum(matched_confidences) / len(matched_confidences)
-                if matched_confidences
+                self._matched_confidence_sum / self.total_matched
+                if self.total_matched
                 else 0.0
             )
-
-            total_candidates = sum(r.total_candidates_retrieved for r in self.results)
-            self.average_candidates_per_email = total_candidates / self.total_emails
+            self.average_candidates_per_email = (
+                self._total_candidates / self.total_emails
+            )
 
     def get_summary(self) -> dict:
         """Get batch summary."""
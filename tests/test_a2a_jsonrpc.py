@@ -32,6 +32,12 @@ def test_jsonrpc_status_ok():
     first_part = result["parts"][0]
     assert first_part["kind"] == "text"
     assert "healthy" in first_part["text"].lower()
+    assert body["error"] is None
+
+    # Repeat calls reuse the status result but carry their own request ID
+    again = client.post("/a2a/agent/bankMatcher", json={**payload, "id": 2}).json()
+    assert again["id"] == 2
+    assert again["result"] == result
 
 
 @pytest.mark.asyncio
@@ -107,6 +113,62 @@ def test_jsonrpc_execute_accepts():
     assert "running" in status_data
 
 
+def test_orjson_response_renders_payload():
+    """ORJSONResponse should render datetimes and non-string keys."""
+    import json
+    from datetime import datetime, timezone
+
+    from app.a2a.router import ORJSONResponse
+
+    resp = ORJSONResponse(
+        content={"at": datetime(2025, 1, 1, tzinfo=timezone.utc), 1: "one"}
+    )
+    assert resp.media_type == "application/json"
+    assert json.loads(resp.body) == {"at": "2025-01-01T00:00:00+00:00", "1": "one"}
+
+
+def test_orjson_response_renders_decimal_exactly():
+    """ORJSONResponse should emit Decimal amounts as exact JSON numbers."""
+    from decimal import Decimal
+
+    from app.a2a.router import ORJSONResponse
+
+    resp = ORJSONResponse(content={"amount": Decimal("12345678901234.57")})
+    assert resp.body == b'{"amount":12345678901234.57}'
+
+
+def test_json_fragment_renders_like_inline_data():
+    """Pre-encoded artifacts should render byte-for-byte like inline data."""
+    from datetime import datetime, timezone
+    from decimal import Decimal
+
+    from app.a2a.router import (
+        JSONRPCResponse,
+        Message,
+        MessagePart,
+        ORJSONResponse,
+        _json_fragment,
+    )
+
+    artifacts = [
+        {
+            "kind": "unmatched_email",
+            "data": {
+                "amount": Decimal("2500.10"),
+                "received_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "reference": None,
+            },
+        }
+    ]
+
+    def render(data):
+        message = Message(parts=[MessagePart(kind="data", data=data)])
+        resp = JSONRPCResponse(id=1, result=message)
+        return ORJSONResponse(content=resp.model_dump()).body
+
+    assert render(_json_fragment(artifacts)) == render(artifacts)
+
+
 def test_jsonrpc_unknown_method_still_unimplemented():
     client = TestClient(app)
     payload = {"jsonrpc": "2.0", "id": "unknown", "method": "unknown"}
@@ -115,3 +177,14 @@ def test_jsonrpc_unknown_method_still_unimplemented():
     body = resp.json()
     assert body["id"] == "unknown"
     assert "error" in body and body["error"]["code"] == -32601
+
+
+def test_jsonrpc_invalid_json_body_rejected():
+    client = TestClient(app)
+    resp = client.post(
+        "/a2a/agent/bankMatcher",
+        content=b'{"jsonrpc": "2.0", "id": ',
+        headers={"Content-Type": "application/json"},
+    )
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Invalid JSON body"
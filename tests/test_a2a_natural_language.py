@@ -2,10 +2,24 @@
 Integration tests for A2A endpoint with natural language command support.
 """
 
+import asyncio
 import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from app.main import app
 from app.db.base import get_db
+from app.db.unit_of_work import UnitOfWork
+from app.a2a.command_handlers import CommandHandlers, MAX_ALTERNATIVES_PER_RESULT
+from app.a2a.command_interpreter import get_interpreter
+from app.matching.models import (
+    BatchMatchResult,
+    MatchCandidate,
+    MatchResult,
+    RuleScore,
+)
 from tests.conftest import get_test_db
 
 
@@ -463,5 +477,386 @@ class TestResponseFormat:
                 assert "data" in part
 
 
+@pytest.mark.asyncio
+class TestCommandHandlers:
+    """Test command handlers directly against the test database."""
+
+    async def test_show_summary_counts(self, db_session, monkeypatch):
+        """Test that show_summary renders the aggregated window counts."""
+        from app.a2a import command_handlers
+
+        monkeypatch.setattr(command_handlers, "_SUMMARY_CACHE", {})
+        async with UnitOfWork(session=db_session) as uow:
+            email = await uow.emails.create(
+                message_id="test-handler-summary@test.com",
+                sender="alerts@bank.com",
+                subject="Test",
+                body="Body",
+            )
+            transaction = await uow.transactions.create(
+                transaction_id="TEST-HANDLER-SUMMARY-TXN",
+                external_source="paystack",
+                amount=2500.00,
+                currency="NGN",
+                transaction_timestamp=datetime.now(timezone.utc),
+            )
+            match = await uow.matches.create_match(
+                email_id=email.id,
+                transaction_id=transaction.id,
+                matched=True,
+                confidence=0.7,
+            )
+            await uow.matches.update_match_status(match.id, "review")
+            await uow.commit()
+
+        handlers = CommandHandlers(db_session)
+        result = await handlers.show_summary({"days": 7})
+        assert result["status"] == "success"
+
+        since = datetime.fromisoformat(result["meta"]["since"])
+        counts = await handlers.match_repo.get_summary_counts(since)
+        data = result["artifacts"][0]["data"]
+
+        assert data["emails"]["total"] == counts["emails"]
+        assert data["emails"]["matched"] == counts["matches"]
+        assert data["emails"]["unmatched"] == counts["emails"] - counts["matches"]
+        assert data["transactions"]["total"] == counts["transactions"]
+        assert data["matches"] == {
+            "auto_matched": counts["matched"],
+            "needs_review": counts["review"],
+            "rejected": counts["rejected"],
+            "no_candidates": counts["no_candidates"],
+        }
+        assert counts["review"] >= 1
+        assert f"Needs review: {counts['review']}" in result["summary"]
+        assert f"Total: {counts['transactions']}" in result["summary"]
+
+    async def test_show_summary_cached_until_fetch(self, db_session, monkeypatch):
+        """Test that show_summary is reused until a fetch invalidates it."""
+        from app.a2a import command_handlers
+
+        async def fake_trigger_fetch():
+            return SimpleNamespace(
+                run_id="run-1",
+                emails_fetched=0,
+                emails_processed=0,
+                emails_stored=0,
+                error=None,
+            )
+
+        monkeypatch.setattr(command_handlers, "_SUMMARY_CACHE", {})
+        monkeypatch.setattr(command_handlers, "trigger_fetch", fake_trigger_fetch)
+
+        handlers = CommandHandlers(db_session)
+        first = await handlers.show_summary({"days": 3})
+        assert first["status"] == "success"
+        assert await handlers.show_summary({"days": 3}) is first
+        assert await handlers.show_summary({"days": 4}) is not first
+
+        assert (await handlers.fetch_emails_now({}))["status"] == "success"
+        refreshed = await handlers.show_summary({"days": 3})
+        assert refreshed is not first
+        assert refreshed["artifacts"] == first["artifacts"]
+
+        # The cache holds a bounded number of look-back windows
+        monkeypatch.setattr(command_handlers, "SUMMARY_CACHE_MAX_ENTRIES", 2)
+        for days in (5, 6, 7):
+            await handlers.show_summary({"days": days})
+        assert list(command_handlers._SUMMARY_CACHE) == [6, 7]
+
+    async def test_list_unmatched_renders_newest_items(self, db_session):
+        """Test that list_unmatched renders unmatched emails and transactions."""
+        async with UnitOfWork(session=db_session) as uow:
+            email = await uow.emails.create(
+                message_id="test-handler-unmatched@test.com",
+                sender="alerts@unmatched.com",
+                subject="Test",
+                body="Body",
+                amount=1234.50,
+                currency="NGN",
+            )
+            transaction = await uow.transactions.create(
+                transaction_id="TEST-HANDLER-UNMATCHED-TXN",
+                external_source="paystack",
+                amount=4321.00,
+                currency="NGN",
+                reference="UNMATCHED/REF",
+                transaction_timestamp=datetime.now(timezone.utc),
+            )
+            await uow.commit()
+
+        handlers = CommandHandlers(db_session)
+        result = await handlers.list_unmatched({"limit": 1})
+        assert result["status"] == "success"
+
+        summary = result["summary"]
+        assert summary.startswith("📋 **Unmatched Items**\n\n")
+        assert "**Emails** (Showing 1)\n" in summary
+        assert f"  • Email #{email.id} - alerts@unmatched.com - ₦1,234.50" in summary
+        assert (
+            f"  • Transaction #{transaction.id} - UNMATCHED/REF - NGN4,321.00"
+            in summary
+        )
+
+        kinds = [artifact["kind"] for artifact in result["artifacts"]]
+        assert kinds == ["unmatched_email", "unmatched_transaction"]
+        assert result["meta"]["email_count"] == 1
+
+        # An email sharing the first one's created_at is on the next page,
+        # not skipped at the page boundary
+        async with UnitOfWork(session=db_session) as uow:
+            twin = await uow.emails.create(
+                message_id="test-handler-unmatched-twin@test.com",
+                sender="alerts@unmatched.com",
+                subject="Test",
+                body="Body",
+                amount=99.00,
+                currency="NGN",
+                created_at=email.created_at,
+            )
+            await uow.commit()
+
+        first_page = await handlers.list_unmatched({"limit": 1})
+        cursor = first_page["meta"]["next_email_cursor"]
+        assert f'"list unmatched email cursor {cursor}"' in first_page["summary"]
+        next_page = await handlers.list_unmatched({"limit": 1, "email_cursor": cursor})
+        assert next_page["status"] == "success"
+        seen = {
+            artifact["data"]["email_id"]
+            for page in (first_page, next_page)
+            for artifact in page["artifacts"]
+            if artifact["kind"] == "unmatched_email"
+        }
+        assert seen == {email.id, twin.id}
+
+    async def test_reconciliation_artifacts_limit(self, db_session):
+        """Test that reconciliation artifacts are built lazily and bounded."""
+        batch = BatchMatchResult()
+        for i in range(5):
+            batch.add_result(
+                MatchResult(
+                    email_id=i,
+                    email_message_id=f"msg-{i}@test.com",
+                    match_status="no_candidates",
+                )
+            )
+        batch.finalize()
+
+        handlers = CommandHandlers(db_session)
+
+        # Match results are plain pydantic models: building artifacts must
+        # not trigger any lazy-load SQL.
+        statements = []
+        sync_engine = db_session.bind.sync_engine
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", _record)
+        try:
+            artifacts = handlers._build_reconciliation_artifacts(batch, limit=3)
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _record)
+        assert statements == []
+        assert [a["data"]["email_id"] for a in artifacts] == [0, 1, 2]
+        assert artifacts[0]["kind"] == "reconciliation_result"
+        assert artifacts[0]["data"]["best_candidate"] is None
+
+        assert len(handlers._build_reconciliation_artifacts(batch)) == 5
+
+    async def test_reconciliation_artifacts_cap_alternatives(self, db_session):
+        """Test candidate serialization and the alternatives cap."""
+        best = MatchCandidate(
+            transaction_id=99,
+            external_transaction_id="TXN-BEST",
+            amount=Decimal("100.00"),
+            currency="NGN",
+            timestamp=datetime.now(timezone.utc),
+            total_score=0.9,
+            rule_scores=[
+                RuleScore(
+                    rule_name="exact_amount",
+                    score=1.0,
+                    weight=0.3,
+                    weighted_score=0.3,
+                    details={"delta": 0},
+                )
+            ],
+        )
+        alternatives = [
+            MatchCandidate(
+                transaction_id=i,
+                external_transaction_id=f"TXN-{i}",
+                amount=Decimal("100.00"),
+                currency="NGN",
+                timestamp=datetime.now(timezone.utc),
+                rank=i + 1,
+            )
+            for i in range(MAX_ALTERNATIVES_PER_RESULT + 3)
+        ]
+        batch = BatchMatchResult()
+        batch.add_result(
+            MatchResult(
+                email_id=1,
+                email_message_id="msg-alternatives@test.com",
+                match_status="needs_review",
+                best_candidate=best,
+                alternative_candidates=alternatives,
+            )
+        )
+
+        handlers = CommandHandlers(db_session)
+        (artifact,) = handlers._build_reconciliation_artifacts(batch)
+        assert artifact["data"]["best_candidate"] == {
+            "transaction_id": 99,
+            "external_transaction_id": "TXN-BEST",
+            "score": 0.9,
+            "rule_scores": [
+                {
+                    "rule": "exact_amount",
+                    "score": 1.0,
+                    "weight": 0.3,
+                    "weighted": 0.3,
+                    "details": {"delta": 0},
+                }
+            ],
+        }
+        assert artifact["data"]["alternatives"][0] == {
+            "transaction_id": 0,
+            "external_transaction_id": "TXN-0",
+            "score": 0.0,
+            "rank": 1,
+        }
+        ranks = [alt["rank"] for alt in artifact["data"]["alternatives"]]
+        assert ranks == list(range(1, MAX_ALTERNATIVES_PER_RESULT + 1))
+
+    async def test_fetch_all_now_runs_fetches_concurrently(
+        self, db_session, monkeypatch
+    ):
+        """Test that fetch_all_now overlaps both fetches and merges results."""
+        running = []
+        overlapped = []
+
+        def fake_fetch(kind, status):
+            async def _fetch(self, params):
+                running.append(kind)
+                await asyncio.sleep(0)
+                overlapped.append(len(running) == 2)
+                return {
+                    "status": status,
+                    "summary": f"{kind} done",
+                    "artifacts": [{"kind": kind}],
+                    "meta": {"source": kind},
+                }
+
+            return _fetch
+
+        monkeypatch.setattr(
+            CommandHandlers, "fetch_emails_now", fake_fetch("emails", "success")
+        )
+        monkeypatch.setattr(
+            CommandHandlers, "fetch_transactions_now", fake_fetch("txns", "error")
+        )
+
+        result = await CommandHandlers(db_session).fetch_all_now({})
+        assert overlapped == [True, True]
+        assert result["status"] == "partial"
+        assert result["summary"] == "emails done\n\ntxns done"
+        assert [a["kind"] for a in result["artifacts"]] == ["emails", "txns"]
+        assert result["meta"] == {
+            "emails": {"source": "emails"},
+            "transactions": {"source": "txns"},
+        }
+
+        interpreter = get_interpreter()
+        for text in ("fetch new emails and poll transactions", "sync everything"):
+            assert interpreter.interpret(text).command_name == "fetch_all_now"
+        # Listing requests that say "all" must not start any fetch
+        for text in ("get all matches", "get all transactions", "get all unmatched"):
+            assert interpreter.interpret(text).command_name != "fetch_all_now"
+
+    async def test_match_now_background_job(self, db_session, test_db, monkeypatch):
+        """Test that background match_now returns a job ID, then its result."""
+        from app.a2a import command_handlers
+
+        release = asyncio.Event()
+
+        async def fake_match_unmatched(db, limit=None):
+            await release.wait()
+            batch = BatchMatchResult()
+            batch.add_result(
+                MatchResult(
+                    email_id=1,
+                    email_message_id="msg-background@test.com",
+                    match_status="no_candidates",
+                )
+            )
+            batch.finalize()
+            return batch
+
+        monkeypatch.setattr(command_handlers, "AsyncSessionLocal", test_db)
+        monkeypatch.setattr(command_handlers, "match_unmatched", fake_match_unmatched)
+
+        interpreter = get_interpreter()
+        command = interpreter.interpret("match emails in the background")
+        assert command.command_name == "match_now"
+        assert command.params["background"] is True
+
+        handlers = CommandHandlers(db_session)
+        accepted = await handlers.match_now(command.params)
+        assert accepted["status"] == "accepted"
+        job_id = accepted["meta"]["job_id"]
+
+        # Only one job runs at a time; a second request gets the running one
+        again = await handlers.match_now(command.params)
+        assert again["status"] == "pending"
+        assert again["meta"]["job_id"] == job_id
+        assert list(command_handlers._MATCH_JOBS) == [job_id]
+
+        command = interpreter.interpret(f"match result {job_id}")
+        assert command.command_name == "match_result"
+        assert command.params == {"job_id": job_id}
+
+        pending = await handlers.match_result(command.params)
+        assert pending["status"] == "pending"
+
+        release.set()
+        await command_handlers._MATCH_JOBS[job_id].task
+
+        done = await handlers.match_result(command.params)
+        assert done["status"] == "success"
+        assert done["meta"]["job_id"] == job_id
+        assert done["meta"]["batch"]["no_candidates"] == 1
+        assert job_id not in command_handlers._MATCH_JOBS
+
+        missing = await handlers.match_result(command.params)
+        assert missing["status"] == "error"
+
+        # Questions about matches without a job ID are not job lookups
+        for text in ("show match results for today", "list matching jobs"):
+            assert interpreter.interpret(text).command_name != "match_result"
+
+    async def test_unread_match_jobs_expire(self, db_session, monkeypatch):
+        """Test that finished jobs nobody reads are pruned after their TTL."""
+        from app.a2a import command_handlers
+
+        async def failing_job(limit):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(command_handlers, "_run_match_job", failing_job)
+        monkeypatch.setattr(command_handlers, "MATCH_JOB_TTL_SECONDS", 0.0)
+
+        handlers = CommandHandlers(db_session)
+        accepted = await handlers.match_now({"background": True})
+        job = command_handlers._MATCH_JOBS[accepted["meta"]["job_id"]]
+        with pytest.raises(RuntimeError):
+            await job.task
+        await asyncio.sleep(0)  # let the done callback run
+        assert job.finished_at is not None
+
+        command_handlers._prune_match_jobs()
+        assert not command_handlers._MATCH_JOBS
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -122,6 +122,72 @@ class TestCommandInterpreter:
         assert match2.command_name == "test_reconcile"
         assert match1.confidence >= match2.confidence
 
+    def test_example_phrases_route_like_full_scan(self, interpreter):
+        """Test that example-phrase lookups agree with the ordered scan."""
+        interpreter.interpret("help")
+        assert interpreter._exact_routes["show summary"] == ("test_summary", 0)
+
+        # A later command cannot claim an example an earlier one matches
+        interpreter.register_command(
+            name="test_status",
+            patterns=[r"\bstatus\b"],
+            handler=None,
+            description="Test status command",
+            examples=["get status", "status"],
+        )
+        assert interpreter._exact_routes is None
+
+        assert interpreter.interpret("Get Status").command_name == "test_summary"
+        assert interpreter.interpret("status").command_name == "test_status"
+        assert interpreter._exact_routes["get status"] == ("test_summary", 1)
+
+    def test_interpret_caches_repeated_messages(self, interpreter):
+        """Test that repeated messages reuse the cached interpretation."""
+        first = interpreter.interpret("  please reconcile now ")
+        first.params["mutated"] = True
+        assert "please reconcile now" in interpreter._match_cache
+
+        second = interpreter.interpret("please reconcile now")
+        assert second.command_name == "test_reconcile"
+        assert second.confidence == first.confidence
+        assert second.params == {}
+
+        interpreter.register_command(
+            name="test_now",
+            patterns=[r"\bnow\b"],
+            handler=None,
+            description="Test now command",
+            examples=["now"],
+        )
+        assert not interpreter._match_cache
+
+    def test_extract_text_prefers_latest_history_message(self, interpreter):
+        """Test text extraction from history, first part and plain payloads."""
+        history = {
+            "params": {
+                "message": {
+                    "parts": [
+                        {"kind": "text", "text": "ignored"},
+                        {
+                            "kind": "data",
+                            "data": [
+                                {"kind": "text", "text": "older"},
+                                {"kind": "text", "text": "  show summary "},
+                            ],
+                        },
+                    ]
+                }
+            }
+        }
+        assert interpreter.extract_text(history) == "show summary"
+
+        history["params"]["message"]["parts"][1]["data"][-1]["text"] = "  "
+        assert interpreter.extract_text(history) == "ignored"
+
+        plain = {"params": {"message": {"parts": [{"kind": "text", "text": "help"}]}}}
+        assert interpreter.extract_text(plain) == "help"
+        assert interpreter.extract_text({"params": {"text": " status "}}) == "status"
+
     def test_get_help_text(self, interpreter):
         """Test help text generation."""
         help_text = interpreter.get_help_text()
@@ -225,6 +291,32 @@ class TestParameterExtraction:
         rematch = extract_rematch_flag(message, match)
         assert rematch is False
 
+    def test_extract_interval_and_hours(self):
+        """Test interval and hours extraction."""
+        from app.a2a.command_handlers import extract_hours, extract_interval
+
+        assert extract_interval("start automation every 300 seconds", None) == 300
+        assert extract_interval("start automation with 5 minute intervals", None) == 300
+        assert extract_interval("run every 2 hours", None) == 7200
+        assert extract_interval("start automation", None) is None
+
+        assert extract_hours("metrics for the last 24 hours", None) == 24
+        assert extract_hours("show metrics", None) is None
+
+    def test_extract_cursors(self):
+        """Test page cursor extraction for list_unmatched."""
+        from app.a2a.command_handlers import (
+            extract_email_cursor,
+            extract_limit,
+            extract_transaction_cursor,
+        )
+
+        message = "list unmatched email cursor c32303235 transaction cursor c5f3432"
+        assert extract_email_cursor(message, None) == "c32303235"
+        assert extract_transaction_cursor(message, None) == "c5f3432"
+        assert extract_limit(message, None) is None
+        assert extract_email_cursor("list unmatched", None) is None
+
 
 @pytest.mark.asyncio
 class TestEndToEndCommands:
@@ -85,6 +85,37 @@ class TestEmailRepository:
             assert updated.is_processed is True
             await uow.commit()
 
+    async def test_list_unmatched(self, db_session):
+        """Test that list_unmatched excludes emails with a match record."""
+        async with UnitOfWork(session=db_session) as uow:
+            matched_email = await uow.emails.create(
+                message_id="test-list-unmatched-matched@test.com",
+                sender="alerts@bank.com",
+                subject="Matched",
+                body="Body",
+            )
+            unmatched_email = await uow.emails.create(
+                message_id="test-list-unmatched-open@test.com",
+                sender="alerts@bank.com",
+                subject="Unmatched",
+                body="Body",
+            )
+            await uow.matches.create_match(
+                email_id=matched_email.id,
+                transaction_id=None,
+                matched=False,
+                confidence=0.0,
+            )
+            await uow.commit()
+
+            unmatched = await uow.emails.list_unmatched(limit=1000)
+            unmatched_ids = {e.id for e in unmatched}
+            assert unmatched_email.id in unmatched_ids
+            assert matched_email.id not in unmatched_ids
+
+            limited = await uow.emails.list_unmatched(limit=1)
+            assert len(limited) == 1
+
 
 @pytest.mark.asyncio
 class TestTransactionRepository:
@@ -231,6 +262,38 @@ class TestMatchRepository:
             assert len(matched) > 0
             assert all(m.matched is True for m in matched)
 
+    async def test_batch_existence_checks(self, db_session):
+        """Test set-based email existence and prior-match lookups."""
+        async with UnitOfWork(session=db_session) as uow:
+            matched_email = await uow.emails.create(
+                message_id="test-batch-exists-matched@test.com",
+                sender="alerts@bank.com",
+                subject="Test",
+                body="Body",
+            )
+            fresh_email = await uow.emails.create(
+                message_id="test-batch-exists-fresh@test.com",
+                sender="alerts@bank.com",
+                subject="Test",
+                body="Body",
+            )
+            await uow.matches.create_match(
+                email_id=matched_email.id,
+                transaction_id=None,
+                matched=False,
+                confidence=0.2,
+            )
+            await uow.commit()
+
+        missing_id = fresh_email.id + 10_000
+        ids = [matched_email.id, fresh_email.id, missing_id]
+        async with UnitOfWork(session=db_session) as uow:
+            assert await uow.emails.get_existing_ids(ids) == {
+                matched_email.id,
+                fresh_email.id,
+            }
+            assert await uow.matches.get_email_ids_with_match(ids) == {matched_email.id}
+
     async def test_get_match_statistics(self, db_session):
         """Test getting match statistics."""
         async with UnitOfWork(session=db_session) as uow:
@@ -241,6 +304,56 @@ class TestMatchRepository:
             assert "average_confidence" in stats
             assert "match_rate" in stats
 
+            distribution = stats["confidence_distribution"]
+            assert sum(distribution.values()) == stats["total"]
+            assert stats["matched"] + stats["unmatched"] == stats["total"]
+
+            future = await uow.matches.get_match_statistics(
+                since=datetime(2999, 1, 1, tzinfo=timezone.utc)
+            )
+            assert future["total"] == 0
+            assert future["average_confidence"] == 0.0
+
+    async def test_get_summary_counts(self, db_session):
+        """Test single-query summary counts for a time window."""
+        since = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        async with UnitOfWork(session=db_session) as uow:
+            before = await uow.matches.get_summary_counts(since)
+
+            email = await uow.emails.create(
+                message_id="test-summary-counts@test.com",
+                sender="alerts@bank.com",
+                subject="Test",
+                body="Body",
+            )
+            transaction = await uow.transactions.create(
+                transaction_id="TEST-SUMMARY-COUNTS-TXN",
+                external_source="paystack",
+                amount=1500.00,
+                currency="NGN",
+                transaction_timestamp=datetime.now(timezone.utc),
+            )
+            match = await uow.matches.create_match(
+                email_id=email.id,
+                transaction_id=transaction.id,
+                matched=True,
+                confidence=0.6,
+            )
+            await uow.matches.update_match_status(match.id, "review")
+            await uow.commit()
+
+            after = await uow.matches.get_summary_counts(since)
+            assert after["emails"] == before["emails"] + 1
+            assert after["transactions"] == before["transactions"] + 1
+            assert after["matches"] == before["matches"] + 1
+            assert after["review"] == before["review"] + 1
+            assert after["matched"] == before["matched"]
+
+            future = await uow.matches.get_summary_counts(
+                datetime(2999, 1, 1, tzinfo=timezone.utc)
+            )
+            assert all(value == 0 for value in future.values())
+
 
 @pytest.mark.asyncio
 class TestConfigRepository:
@@ -322,6 +435,19 @@ class TestLogRepository:
 class TestUnitOfWork:
     """Test Unit of Work pattern."""
 
+    async def test_repository_for_session_is_cached(self, db_session):
+        """Test that for_session reuses one repository per session and model."""
+        from app.db.models import Email, Match
+        from app.db.repositories import EmailRepository, MatchRepository
+
+        email_repo = EmailRepository.for_session(Email, db_session)
+        assert EmailRepository.for_session(Email, db_session) is email_repo
+        assert email_repo.session is db_session
+
+        match_repo = MatchRepository.for_session(Match, db_session)
+        assert match_repo is not email_repo
+        assert isinstance(match_repo, MatchRepository)
+
     async def test_commit(self, db_session):
         """Test committing changes."""
         async with UnitOfWork(session=db_session) as uow:
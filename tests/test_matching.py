@@ -8,7 +8,7 @@ from app.matching.config import MatchingConfig, RuleWeights, ThresholdConfig
 from app.matching.fuzzy import FuzzyMatcher, quick_ratio
 from app.matching.rules import MatchingRules
 from app.matching.scorer import MatchScorer
-from app.matching.models import MatchCandidate
+from app.matching.models import BatchMatchResult, MatchCandidate, MatchResult
 from app.normalization.models import (
     NormalizedEmail,
     NormalizedTransaction,
@@ -488,5 +488,72 @@ def test_currency_mismatch():
     assert details["match_type"] == "mismatch"
 
 
+def test_batch_result_finalize_statistics():
+    """Test batch statistics accumulated while adding results."""
+    batch = BatchMatchResult()
+    batch.add_result(
+        MatchResult(
+            email_id=1,
+            email_message_id="a",
+            matched=True,
+            confidence=0.9,
+            match_status="auto_matched",
+            total_candidates_retrieved=3,
+        )
+    )
+    batch.add_result(
+        MatchResult(
+            email_id=2,
+            email_message_id="b",
+            matched=True,
+            confidence=0.7,
+            match_status="auto_matched",
+            total_candidates_retrieved=1,
+        )
+    )
+    batch.add_result(
+        MatchResult(
+            email_id=3,
+            email_message_id="c",
+            confidence=0.2,
+            match_status="no_candidates",
+        )
+    )
+    batch.finalize()
+
+    assert batch.total_emails == 3
+    assert batch.total_matched == 2
+    assert batch.total_no_candidates == 1
+    assert batch.average_confidence == pytest.approx(0.8)
+    assert batch.average_candidates_per_email == pytest.approx(4 / 3)
+
+
+@pytest.mark.asyncio
+async def test_match_unmatched_runs_one_batch_at_a_time(monkeypatch):
+    """Test that concurrent match_unmatched calls do not overlap."""
+    import asyncio
+
+    from app.matching import engine
+
+    active = []
+
+    async def fake_match_unmatched_emails(self, limit=None):
+        active.append(limit)
+        assert len(active) == 1
+        await asyncio.sleep(0)
+        active.remove(limit)
+        return BatchMatchResult()
+
+    monkeypatch.setattr(
+        engine.MatchingEngine, "match_unmatched_emails", fake_match_unmatched_emails
+    )
+
+    results = await asyncio.gather(
+        engine.match_unmatched(None, limit=1), engine.match_unmatched(None, limit=2)
+    )
+    assert len(results) == 2
+    assert not active
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])